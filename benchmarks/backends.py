@@ -0,0 +1,55 @@
+"""
+Compares the in-memory json backend with the SQLite backend,
+the peak RSS and the lookup latency are measured in a fresh interpreter per backend
+
+    python benchmarks/backends.py
+"""
+import os
+import sys
+import json
+import subprocess
+
+
+child = """
+import json, resource, time
+start = time.perf_counter()
+import humanePDG
+from humanePDG.humane import getMass, listIDs
+importTime = time.perf_counter() - start
+
+ids = [int(i) for i in listIDs()]
+start = time.perf_counter()
+for i in ids:
+    getMass(i)
+coldLookup = (time.perf_counter() - start) / len(ids)
+
+hot = ids[:32] * 1000
+start = time.perf_counter()
+for i in hot:
+    getMass(i)
+hotLookup = (time.perf_counter() - start) / len(hot)
+
+print(json.dumps({
+    'import [ms]': importTime * 1e3,
+    'cold lookup [us]': coldLookup * 1e6,
+    'hot lookup [us]': hotLookup * 1e6,
+    'peak RSS [MB]': resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+}))
+"""
+
+
+def run(backend: str) -> dict:
+    env = dict(os.environ, HUMANEPDG_BACKEND=backend)
+    env['PYTHONPATH'] = os.pathsep.join(filter(None, [os.path.dirname(os.path.dirname(os.path.abspath(__file__))), env.get('PYTHONPATH')]))
+    # one run to make sure the SQLite file exists, so the build is not measured
+    subprocess.run([sys.executable, '-c', 'import humanePDG'], env=env, check=True)
+    output = subprocess.run([sys.executable, '-c', child], env=env, check=True, capture_output=True, text=True).stdout
+    return json.loads(output)
+
+
+if __name__ == '__main__':
+    results = {backend: run(backend) for backend in ('json', 'sqlite')}
+    metrics = list(results['json'])
+    print(f"{'':>18}" + ''.join(f'{backend:>12}' for backend in results))
+    for metric in metrics:
+        print(f'{metric:>18}' + ''.join(f'{results[backend][metric]:>12.2f}' for backend in results))
@@ -0,0 +1,66 @@
+"""
+Compares looking particles up through the local lookup server with importing humanePDG,
+both for short-lived job steps, that start a fresh interpreter, and per request
+
+    python benchmarks/daemon.py
+"""
+import os
+import sys
+import time
+import subprocess
+import tempfile
+
+
+root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+env = dict(os.environ, PYTHONPATH=os.pathsep.join(filter(None, [root, os.environ.get('PYTHONPATH')])))
+ids = [211, -211, 111, 321, -321, 421, 511, 2212, 11, 13, 22, 310]
+
+inProcessStep = f"""
+import humanePDG
+[humanePDG.getParticle(i) for i in {ids}]
+"""
+clientStep = f"""
+from humanePDG.client import PDGClient
+PDGClient({{path!r}}).map('getParticle', {ids})
+"""
+
+
+def timeSteps(code: str, repeats: int = 10) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        subprocess.run([sys.executable, '-c', code], env=env, check=True)
+    return (time.perf_counter() - start) / repeats
+
+
+def timeCalls(function, repeats: int = 2000) -> float:
+    start = time.perf_counter()
+    for _ in range(repeats):
+        function()
+    return (time.perf_counter() - start) / repeats
+
+
+if __name__ == '__main__':
+    path = os.path.join(tempfile.mkdtemp(), 'humanePDG.sock')
+    server = subprocess.Popen([sys.executable, '-m', 'humanePDG.server', '--socket', path], env=env)
+    try:
+        while not os.path.exists(path):
+            time.sleep(0.05)
+
+        print(f'job step, import humanePDG:  {timeSteps(inProcessStep) * 1e3:8.2f} ms')
+        print(f'job step, lookup server:     {timeSteps(clientStep.format(path=path)) * 1e3:8.2f} ms')
+
+        sys.path.insert(0, root)
+        import humanePDG
+        from humanePDG.client import PDGClient
+        client = PDGClient(path)
+        # the package is imported lazily, so the first lookups load the database
+        humanePDG.getMass(211)
+        client.getMass(211)
+        print(f'single lookup, in process:   {timeCalls(lambda: humanePDG.getMass(211)) * 1e6:8.2f} us')
+        print(f'single lookup, server:       {timeCalls(lambda: client.getMass(211)) * 1e6:8.2f} us')
+        print(f'1000 lookups, in process:    {timeCalls(lambda: [humanePDG.getMass(i) for i in ids * 84], 100) * 1e3:8.2f} ms')
+        print(f'1000 lookups, server batch:  {timeCalls(lambda: client.map("getMass", ids * 84), 100) * 1e3:8.2f} ms')
+        client.close()
+    finally:
+        server.terminate()
+        server.wait()
@@ -0,0 +1,93 @@
+"""
+Measures how the lookup throughput scales from 1 to N threads, on free-threaded builds
+of Python 3.13+ it should grow with the threads, with the GIL it stays about flat.
+Before timing, all threads hit the lazily built tables at once and the results are compared
+
+    python benchmarks/threads.py --threads 8 --backend sqlite
+"""
+import os
+import sys
+import time
+import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+
+def coldStart(threads: int) -> None:
+    # every thread triggers the lazy loading at the same time, they all have to end up with the same objects
+    import humanePDG
+    barrier = threading.Barrier(threads)
+
+    def firstAccess(_):
+        barrier.wait()
+        from humanePDG import composite
+        return (
+            id(humanePDG.getColumns()), id(humanePDG.getQuarkIndex()), id(composite.PionPlus),
+            humanePDG.conjugateName('D0'), humanePDG.cachedCheckDecay('D0', ['K-', 'pi+']).isPermited
+        )
+
+    with ThreadPoolExecutor(threads) as pool:
+        results = set(pool.map(firstAccess, range(threads)))
+    if len(results) != 1:
+        raise RuntimeError(f'The threads saw different lazily built objects: {results}')
+
+
+def workload(names: list[str], ids: list[int]) -> int:
+    from humanePDG import getMass, getAntiParticle, isMeson, getParticle, conjugateName, cachedCheckDecay
+    for name in names:
+        getMass(name)
+        getParticle(name)
+    for pdgID in ids:
+        getAntiParticle(pdgID)
+        isMeson(pdgID)
+    for name in names[:16]:
+        conjugateName(name)
+    cachedCheckDecay('D0', ['K-', 'pi+'])
+    return 2 * len(names) + 2 * len(ids) + min(len(names), 16) + 1
+
+
+def throughput(threads: int, seconds: float, names: list[str], ids: list[int]) -> float:
+    stop = time.perf_counter() + seconds
+    barrier = threading.Barrier(threads)
+
+    def run(_):
+        barrier.wait()
+        calls = 0
+        while time.perf_counter() < stop:
+            calls += workload(names, ids)
+        return calls
+
+    start = time.perf_counter()
+    with ThreadPoolExecutor(threads) as pool:
+        calls = sum(pool.map(run, range(threads)))
+    return calls / (time.perf_counter() - start)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--threads', type=int, default=os.cpu_count() or 4, help='the largest number of threads')
+    parser.add_argument('--seconds', type=float, default=1.0, help='the duration of every measurement')
+    parser.add_argument('--backend', choices=('json', 'sqlite'), default='json')
+    args = parser.parse_args()
+
+    os.environ['HUMANEPDG_BACKEND'] = args.backend
+    sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    coldStart(args.threads)
+
+    from humanePDG import listIDs, getDefaultDatabase
+    database = getDefaultDatabase()
+    ids = [int(i) for i in listIDs()][:200]
+    names = [database.data[str(i)]['symbol'] for i in ids]
+    # warm up the caches, so the first measurement doesn't pay for them
+    workload(names, ids)
+
+    gil = getattr(sys, '_is_gil_enabled', lambda: True)()
+    print(f"Python {sys.version.split()[0]}, GIL {'enabled' if gil else 'disabled'}, {args.backend} backend")
+    print(f"{'threads':>8}{'calls/s':>14}{'speedup':>10}")
+    threads = 1
+    single = None
+    while threads <= args.threads:
+        rate = throughput(threads, args.seconds, names, ids)
+        single = rate if single is None else single
+        print(f'{threads:>8}{rate:>14.0f}{rate / single:>10.2f}')
+        threads = threads * 2 if threads * 2 <= args.threads or threads == args.threads else args.threads
@@ -1,14 +1,56 @@
-from .humane import (
-    getParticle, getDecayMode, getDecayWidth,
-    getMass, getLifetime, getCharge, getQuarks,
-    getParticleType, getSpinType,
-    isLepton, isBoson, isMeson, isBaryon, isQuark,
-    listNames, listIDs
-)
-from .laws import (
-    chargeConversation, isoSpinConservation,
-    baryonNumberConservation, leptonNumberConservation,
-    checkDecay
-)
-from .create import createParticle
-from .data import *
+import sys
+from importlib import import_module
+
+
+# everything is imported on first use, so the client of the lookup server
+# or a script translating a few IDs doesn't pay for loading the whole database
+_exports = {
+    'humane': [
+        'getParticle', 'getAntiParticle', 'isSelfConjugate', 'getDecayMode', 'getDecayWidth',
+        'getMass', 'getLifetime', 'getCharge', 'getQuarks',
+        'getParticleType', 'getSpinType',
+        'isLepton', 'isBoson', 'isMeson', 'isBaryon', 'isQuark',
+        'listNames', 'listIDs'
+    ],
+    'laws': [
+        'chargeConversation', 'isoSpinConservation',
+        'baryonNumberConservation', 'leptonNumberConservation',
+        'checkDecay', 'conservationLaws', 'DecayCache', 'cachedCheckDecay'
+    ],
+    'create': ['createParticle'],
+    'database': ['ParticleDatabase', 'ParticleOverlay', 'DatabaseDiff', 'getDefaultDatabase', 'setDefaultDatabase'],
+    'data': ['elementaryData', 'compositeData', 'particleData', 'namesData', 'pdgNamesData', 'programmNamesData', 'codeData', 'symbolsData'],
+    'labels': ['LabelFormatter', 'formatLabels', 'latexLabel'],
+    'columns': ['ParticleColumns', 'getColumns', 'toStructuredArray'],
+    'conjugation': ['conjugate', 'conjugateName', 'conjugateDecay', 'conjugateDecayModes'],
+    'descriptor': ['DecayDescriptor', 'DecayNode', 'compileDescriptor', 'matchDecay'],
+    'finalstates': ['finalStates', 'longLivedLifetime'],
+    'quarkindex': ['QuarkIndex', 'getQuarkIndex', 'findByQuarks', 'canonicalQuarks'],
+    'mctruth': ['TruthClassification', 'classifyTruth', 'fromChain', 'decayDepth', 'nearestAncestor', 'ancestorIndices', 'globalMotherIndices'],
+}
+_modules = {name: module for module, names in _exports.items() for name in names}
+
+__all__ = list(_modules)
+
+
+def __getattr__(name: str):
+    if name in _modules:
+        value = getattr(import_module(f'.{_modules[name]}', __name__), name)
+        globals()[name] = value
+        return value
+    try:
+        # submodules, e.g., humanePDG.composite
+        return import_module(f'.{name}', __name__)
+    except ModuleNotFoundError as error:
+        if error.name != f'{__name__}.{name}':
+            raise
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *__all__]
+
+
+# the .pdg accessor comes for free if pandas is loaded already, otherwise import humanePDG.accessor
+if 'pandas' in sys.modules:
+    import_module('.accessor', __name__)
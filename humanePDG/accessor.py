@@ -0,0 +1,99 @@
+import numpy as np
+from .database import ParticleDatabase
+from .columns import getColumns, columnFields, particleTypes
+from .conjugation import conjugate
+from .labels import LabelFormatter
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+
+_fields = [field for field, _ in columnFields if field != 'pdgID']
+
+
+class PDGAccessor:
+    """
+    Maps a Series of PDG IDs to particle properties at once, e.g., df.pdgid.pdg.mass or df.pdgid.pdg.name,
+    every property of the columnar table is available. Missing or unknown IDs get nan, '' or
+    for flags and integers <NA>, as these are returned with the nullable types boolean and Int64
+    """
+    def __init__(self, series: 'pd.Series', database: ParticleDatabase = None) -> None:
+        self._series = series
+        self._database = database
+
+    def __call__(self, database: ParticleDatabase) -> 'PDGAccessor':
+        """
+        Uses another database than the default one, e.g., df.pdgid.pdg(database).mass
+        """
+        return PDGAccessor(self._series, database)
+
+    def _ids(self) -> tuple[np.ndarray, np.ndarray]:
+        values = self._series.to_numpy(dtype=np.float64, na_value=np.nan)
+        present = ~np.isnan(values)
+        return np.where(present, values, 0).astype(np.int64), present
+
+    def _result(self, values: np.ndarray, name: str) -> 'pd.Series':
+        return pd.Series(values, index=self._series.index, name=name)
+
+    def _lookup(self, field: str) -> 'pd.Series':
+        ids, present = self._ids()
+        columns = getColumns(self._database)
+        values = columns.lookup(ids, field)
+        missing = ~(present & columns.index(ids)[1])
+        # flags and integers become the nullable types of pandas, so they don't turn into floats
+        if values.dtype.kind == 'b':
+            values = pd.arrays.BooleanArray(values, missing)
+        elif values.dtype.kind in 'iu':
+            values = pd.arrays.IntegerArray(values.astype(np.int64), missing)
+        elif values.dtype.kind == 'f':
+            values = np.where(missing, np.nan, values)
+        elif values.dtype.kind == 'U':
+            values = np.where(missing, '', values).astype(object)
+        return self._result(values, field)
+
+    def __getattr__(self, name: str) -> 'pd.Series':
+        if name in _fields:
+            return self._lookup(name)
+        raise AttributeError(f"'.pdg' has no attribute {name!r}, use one of {', '.join(_fields)}")
+
+    def __dir__(self) -> list[str]:
+        return [*super().__dir__(), *_fields]
+
+    @property
+    def particleType(self) -> 'pd.Series':
+        ids, present = self._ids()
+        codes = getColumns(self._database).lookup(ids, 'particleType', -1).astype(np.int64)
+        names = np.array([*particleTypes, None], dtype=object)[codes]
+        return self._result(np.where(present, names, None), 'particleType')
+
+    @property
+    def known(self) -> 'pd.Series':
+        ids, present = self._ids()
+        return self._result(present & getColumns(self._database).index(ids)[1], 'known')
+
+    @property
+    def anti(self) -> 'pd.Series':
+        ids, present = self._ids()
+        return self._result(np.where(present, conjugate(ids, self._database), np.nan), 'antiParticle')
+
+    def label(self, style: str = 'unicode') -> 'pd.Series':
+        """
+        Returns a label for every ID in the given style, see LabelFormatter
+        """
+        ids, present = self._ids()
+        return self._result(np.where(present, LabelFormatter(style, self._database)(ids), ''), 'label')
+
+
+def registerAccessor(name: str = 'pdg') -> None:
+    """
+    Registers the accessor for pandas Series, it's done for .pdg when this module is imported
+    """
+    if pd is None:
+        raise ImportError('The pandas accessor needs pandas, install it with pip install humanepdg[pandas].')
+    pd.api.extensions.register_series_accessor(name)(PDGAccessor)
+
+
+if pd is not None:
+    registerAccessor()
@@ -0,0 +1,115 @@
+import socket
+from collections import namedtuple
+from .particle import Charge, SpinType, ParticleType
+from .protocol import frameHeader, JSON, MSGPACK, msgpack, remoteFunctions, defaultSocketPath, encodeFrame, decodePayload
+
+
+# the same fields as laws.ConservationCheckResult, without importing the database
+ConservationCheckResult = namedtuple('ConservationCheckResult', ['isPermited', 'reason'])
+
+_enums = {enum.__name__: enum for enum in (Charge, SpinType, ParticleType)}
+_errors = {error.__name__: error for error in (KeyError, ValueError, TypeError, IndexError, AttributeError, Warning)}
+
+
+def _decodeValue(value):
+    if isinstance(value, dict):
+        if '__decay__' in value:
+            return ConservationCheckResult(*value['__decay__'])
+        if '__enum__' in value:
+            enum, name = value['__enum__']
+            return _enums[enum][name]
+    if isinstance(value, list):
+        return [_decodeValue(v) for v in value]
+    return value
+
+
+def _decodeError(error: list) -> Exception:
+    errorType, message = error
+    return _errors.get(errorType, RuntimeError)(message)
+
+
+class PDGClient:
+    """
+    A thin client for the lookup server started with python -m humanePDG.server,
+    it has the same functions as humanePDG, e.g., client.getMass('pi+'),
+    and batch sends many calls at once in a single request
+    """
+    def __init__(self, path: str = None, timeout: float = None, useMsgpack: bool = None) -> None:
+        self.path = defaultSocketPath() if path is None else path
+        self.timeout = timeout
+        self.encoding = MSGPACK if (msgpack is not None if useMsgpack is None else useMsgpack) else JSON
+        self._socket = None
+
+    def connect(self) -> None:
+        if self._socket is None:
+            self._socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            self._socket.settimeout(self.timeout)
+            self._socket.connect(self.path)
+
+    def close(self) -> None:
+        if self._socket is not None:
+            self._socket.close()
+            self._socket = None
+
+    def __enter__(self) -> 'PDGClient':
+        self.connect()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.close()
+
+    def _receive(self, size: int) -> bytes:
+        chunks = []
+        while size:
+            chunk = self._socket.recv(size)
+            if not chunk:
+                raise ConnectionError('the lookup server closed the connection')
+            chunks.append(chunk)
+            size -= len(chunk)
+        return b''.join(chunks)
+
+    def _request(self, calls: list) -> list:
+        self.connect()
+        self._socket.sendall(encodeFrame({'calls': calls}, self.encoding))
+        encoding, length = frameHeader.unpack(self._receive(frameHeader.size))
+        response = decodePayload(self._receive(length), encoding)
+        if 'error' in response:
+            if self.encoding == MSGPACK:
+                # the server can't read msgpack, so from now on json is used
+                self.encoding = JSON
+                return self._request(calls)
+            raise _decodeError(response['error'])
+        return response['results']
+
+    def batch(self, calls: list, raiseErrors: bool = True) -> list:
+        """
+        Sends many calls, each one as (function, *arguments), in a single request,
+        failed calls raise their error or are returned as exceptions with raiseErrors=False
+        """
+        results = []
+        for isOk, value in self._request([list(call) for call in calls]):
+            if isOk:
+                results.append(_decodeValue(value))
+            elif raiseErrors:
+                raise _decodeError(value)
+            else:
+                results.append(_decodeError(value))
+        return results
+
+    def map(self, function: str, particles: list, *arguments, raiseErrors: bool = True) -> list:
+        """
+        Calls the same function for many particles in a single request
+        """
+        return self.batch([(function, particle, *arguments) for particle in particles], raiseErrors)
+
+
+def _remoteFunction(name: str):
+    def remoteFunction(self, *arguments):
+        return self.batch([(name, *arguments)])[0]
+    remoteFunction.__name__ = name
+    remoteFunction.__doc__ = f'Calls {name} on the lookup server'
+    return remoteFunction
+
+
+for _name in remoteFunctions:
+    setattr(PDGClient, _name, _remoteFunction(_name))
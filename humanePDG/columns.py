@@ -0,0 +1,206 @@
+import threading
+import weakref
+import numpy as np
+from .database import ParticleDatabase, getDefaultDatabase
+from .composite import recordQuarkTerms
+
+
+# the particle types as stored in the particleType column
+particleTypes = ('quark', 'diquark', 'baryon', 'meson', 'lepton', 'boson', 'unknown')
+
+# the bits of the flavor column, set for every quark flavor a particle contains, as quark or anti quark
+flavorBits = {'d': 1, 'u': 2, 's': 4, 'c': 8, 'b': 16, 't': 32}
+
+# the fields of the columnar particle table, missing values are stored as nan or as empty strings,
+# the strings have a fixed width, longer names of custom particles are cut off
+columnFields = [
+    ('pdgID', np.int64),
+    ('antiParticle', np.int64),
+    ('selfConjugated', np.bool_),
+    ('particleType', np.int8),
+    ('flavor', np.uint8),
+    ('charge', np.float64),
+    ('mass', np.float64),
+    ('lifetime', np.float64),
+    ('width', np.float64),
+    ('isoSpin', np.float64),
+    ('angularMomentum', np.float64),
+    ('name', 'U32'),
+    ('symbol', 'U24'),
+    ('pdgName', 'U24'),
+    ('programmName', 'U32'),
+    ('unicode', 'U24'),
+    ('quarks', 'U24'),
+    ('spinType', 'U8'),
+]
+# the values of unknown IDs for the kinds of the fields
+_missingValues = {'f': np.nan, 'i': 0, 'u': 0, 'b': False, 'U': ''}
+_stringFields = {field for field, dtype in columnFields if np.dtype(dtype).kind == 'U'}
+
+
+def _flavor(record: dict) -> int:
+    flavor = 0
+    for quark in set(''.join(recordQuarkTerms(record)).lower()):
+        flavor |= flavorBits[quark]
+    return flavor
+
+
+def _row(record: dict) -> tuple:
+    pdgID = int(record['pdgID'])
+    values = {
+        'pdgID': pdgID,
+        'antiParticle': pdgID if record['selfConjugated'] else -pdgID,
+        'selfConjugated': bool(record['selfConjugated']),
+        'particleType': particleTypes.index(record['particleType']) if record['particleType'] in particleTypes else particleTypes.index('unknown'),
+        'flavor': _flavor(record),
+    }
+    for field, _ in columnFields:
+        if field in _stringFields:
+            values[field] = record.get(field) or ''
+        elif field not in values:
+            values[field] = np.nan if record.get(field) is None else record[field]
+    return tuple(values[field] for field, _ in columnFields)
+
+
+def _readOnly(table: np.ndarray) -> np.ndarray:
+    # the table is handed out without copying, changes replace it instead of writing into it
+    table.flags.writeable = False
+    return table
+
+
+class ParticleColumns:
+    """
+    All particle properties as one structured array sorted by pdgID,
+    so whole arrays of IDs can be looked up at once with searchsorted.
+    Single columns are read only views on the table and can be used without copying
+    """
+    def __init__(self, database: ParticleDatabase) -> None:
+        # taken before reading, so changes during the build make the columns stale instead of getting lost
+        self.version = database.version
+        table = np.array([_row(database.data[key]) for key in database.data], dtype=columnFields)
+        self.table = _readOnly(np.sort(table, order='pdgID'))
+
+    def __getitem__(self, field: str) -> np.ndarray:
+        return self.table[field]
+
+    def __len__(self) -> int:
+        return len(self.table)
+
+    def update(self, database: ParticleDatabase, changed: list[str], version: int) -> 'ParticleColumns':
+        """
+        Returns new columns with only the rows of the changed particles replaced, inserted or removed,
+        the columns themselves are never changed, so other threads can keep using them
+        """
+        table = self.table
+        for key in changed:
+            pdgID = int(key)
+            index = np.searchsorted(table['pdgID'], pdgID)
+            exists = index < len(table) and table['pdgID'][index] == pdgID
+            if key in database.data:
+                row = np.array([_row(database.data[key])], dtype=columnFields)
+                table = np.concatenate((table[:index], row, table[index + exists:]))
+            elif exists:
+                table = np.delete(table, index)
+        columns = ParticleColumns.__new__(ParticleColumns)
+        columns.table = _readOnly(table)
+        columns.version = version
+        return columns
+
+    def index(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+        """
+        Returns the row of every ID and a mask which of the IDs are known
+        """
+        ids = np.asarray(ids)
+        pdgIDs = self.table['pdgID']
+        index = np.searchsorted(pdgIDs, ids)
+        index = np.minimum(index, len(pdgIDs) - 1)
+        found = pdgIDs[index] == ids
+        return index, found
+
+    def lookup(self, ids: np.ndarray, field: str, default=None) -> np.ndarray:
+        """
+        Returns the given field for an array of IDs, unknown IDs get the default value, if none is given
+        the one of the type of the field, nan for floats, 0 for integers, False for flags and '' for strings,
+        so the result keeps the type of the field
+        """
+        index, found = self.index(ids)
+        column = self.table[field]
+        if default is None:
+            default = _missingValues[column.dtype.kind]
+        return np.where(found, column[index], default)
+
+
+class PatchedCache:
+    """
+    Keeps something derived from a database, e.g., the columns, up to date. It's patched
+    for the changed particles as long as every change was seen and rebuilt otherwise.
+    derived is built as derived(database) and has to provide version and
+    update(database, changed, version), returning a new object instead of changing itself.
+    New objects are only published when they are complete, reading the current one takes no lock
+    """
+    def __init__(self, database: ParticleDatabase, derived: type) -> None:
+        self._lock = threading.Lock()
+        self._derived = derived
+        self.current = derived(database)
+        self.changed = []
+        self.changes = 0
+        database.addListener(self.collect)
+
+    def collect(self, database: ParticleDatabase, changed: list[str]) -> None:
+        with self._lock:
+            self.changed.extend(changed)
+            self.changes += 1
+
+    def get(self, database: ParticleDatabase):
+        current = self.current
+        version = database.version
+        if current.version == version:
+            return current
+        with self._lock:
+            current = self.current
+            if current.version != version:
+                if current.version + self.changes == version:
+                    current = current.update(database, self.changed, version)
+                else:
+                    current = self._derived(database)
+                self.changed = []
+                self.changes = 0
+                self.current = current
+        return current
+
+
+def cachedPerDatabase(caches: weakref.WeakKeyDictionary, lock: threading.Lock, database: ParticleDatabase, derived: type):
+    """
+    Returns the up to date derived object of a database from one of the caches, creating the cache on first use
+    """
+    cache = caches.get(database)
+    if cache is None:
+        with lock:
+            cache = caches.get(database)
+            if cache is None:
+                cache = caches[database] = PatchedCache(database, derived)
+    return cache.get(database)
+
+
+_columnsCaches = weakref.WeakKeyDictionary()
+_columnsLock = threading.Lock()
+
+
+def getColumns(database: ParticleDatabase = None) -> ParticleColumns:
+    """
+    Returns the columnar particle table of a database, by default of the default database,
+    it's only built once and kept up to date with the changes of the database
+    """
+    database = getDefaultDatabase() if database is None else database
+    return cachedPerDatabase(_columnsCaches, _columnsLock, database, ParticleColumns)
+
+
+def toStructuredArray(fields: list[str] = None, database: ParticleDatabase = None, copy: bool = False) -> np.ndarray:
+    """
+    Returns the particle table as a structured array with fixed width fields, sorted by pdgID.
+    Without copy it's a read only view on the columnar table, e.g., for joins with ntuples
+    """
+    table = getColumns(database).table
+    if fields is not None:
+        table = table[list(fields)]
+    return table.copy() if copy else table
@@ -7,9 +7,6 @@ import re
 from importlib_resources import files, as_file
 
 
-__all__ = []
-
-
 class Composite(Particle):
     def __init__(self, quarks: list[str], *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -88,6 +85,36 @@ class QuarkSuperposition():
         return joiner.join(terms)
 
 
+def quarkTerms(quarks: str) -> list[str]:
+    """
+    Splits the quark content into the quark combinations it is made of, upper case
+    letters are anti quarks, e.g., uD -> [uD], (uU-dD)/sqrt(2) -> [uU, dD], x(uU+dD)+y(sS) -> [uU, dD, sS]
+    """
+    if not '/' in quarks and not '+' in quarks and not '-' in quarks:
+        return [quarks] if quarks and all(q in 'udscbtUDSCBT' for q in quarks) else []
+    if '/' in quarks:
+        return QuarkSuperposition.quarkPattern1.findall(quarks) + QuarkSuperposition.quarkPattern2.findall(quarks)
+    terms = []
+    for _, content in QuarkSuperposition.coefficientPattern.findall(quarks):
+        terms += QuarkSuperposition.quarkPattern1.findall(content) + QuarkSuperposition.quarkPattern2.findall(content)
+    return terms
+
+
+def recordQuarkTerms(record: dict) -> list[str]:
+    """
+    Same as quarkTerms for a particle of the database, quarks and diquarks have no quark content
+    stored, it's read from their ID instead, e.g., 2203 -> [uu], -2101 -> [UD]
+    """
+    pdgID = int(record['pdgID'])
+    if record['particleType'] == 'quark':
+        quarks = 'duscbt'[abs(pdgID) - 1]
+    elif record['particleType'] == 'diquark':
+        quarks = 'duscbt'[abs(pdgID) // 1000 % 10 - 1] + 'duscbt'[abs(pdgID) // 100 % 10 - 1]
+    else:
+        return quarkTerms(record.get('quarks') or '')
+    return [quarks if pdgID > 0 else quarks.upper()]
+
+
 class Meson(Composite):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -109,35 +136,41 @@ class DiQuark(Composite):
         self.spinType = SpinType.FULL
 
 
-# Dynamically create classes and instances based on the data
-for key in compositeData:
-    name = compositeData[key]['name']
-    kwargs = compositeData[key]
-
-    if compositeData[key]['particleType'] == 'meson':
-        baseClass = Meson
-    elif compositeData[key]['particleType'] == 'baryon':
-        baseClass = Baryon
-    elif compositeData[key]['particleType'] == 'diquark':
-        baseClass = DiQuark
-
-    # Create the new class
-    newClass = type(name, (baseClass,), {})
-
-    # Check for name collisions
-    if name in globals():
-        print(f"Warning: A class named {name} already exists.")
-
-    globals()[name] = newClass(**kwargs)  # Create an instance and store it in globals
-    __all__.append(name)
-
-    if 'Beauty' in name:
-        secondName = name.replace('Beauty', 'BMeson')
-        secondClass = type(secondName, (baseClass,), {})
-        globals()[secondName] = secondClass(**kwargs)  # Create an instance and store it in globals
-        __all__.append(secondName)
-    if 'Duty' in name:
-        thirdName = name.replace('Duty', 'DMeson')
-        thirdClass = type(thirdName, (baseClass,), {})
-        globals()[thirdName] = thirdClass(**kwargs)  # Create an instance and store it in globals
-        __all__.append(thirdName)
+# the particle classes are created on first import, not when loading the module
+_baseClasses = {'meson': Meson, 'baryon': Baryon, 'diquark': DiQuark}
+_classNames = None
+
+
+def _importNames() -> dict[str, str]:
+    """
+    Maps every importable name to the ID of its particle, this includes
+    the BMeson and DMeson aliases of Beauty and Duty
+    """
+    global _classNames
+    if _classNames is None:
+        classNames = {}
+        for key in compositeData:
+            name = compositeData[key]['name']
+            classNames[name] = key
+            if 'Beauty' in name:
+                classNames[name.replace('Beauty', 'BMeson')] = key
+            if 'Duty' in name:
+                classNames[name.replace('Duty', 'DMeson')] = key
+        _classNames = classNames
+    return _classNames
+
+
+def __getattr__(name: str):
+    if name == '__all__':
+        return list(_importNames())
+    if name not in _importNames():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    kwargs = compositeData[_importNames()[name]]
+    newClass = type(name, (_baseClasses[kwargs['particleType']],), {})
+    # Create an instance and store it in globals, a thread that created one at the same time gets the one stored first
+    return globals().setdefault(name, newClass(**kwargs))
+
+
+def __dir__() -> list[str]:
+    return [*globals(), *_importNames()]
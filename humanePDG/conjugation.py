@@ -0,0 +1,223 @@
+import re
+from functools import lru_cache
+import numpy as np
+from .database import ParticleDatabase, getDefaultDatabase
+from .columns import getColumns
+
+
+_chargePattern = re.compile(r'^(?P<body>.*?)(?P<charge>\+\+|--|\+|-|0)?$')
+_flippedCharges = {'+': '-', '-': '+', '++': '--', '--': '++', '0': '0', None: None}
+_tokenPattern = re.compile(r'[^\s\[\]]+')
+# tokens of decay descriptors that are not particles
+_descriptorTokens = {'->', '-->', '=>', 'cc', 'CC'}
+# the tables of the naming conventions with the field of the records they hold, in the order findParticle checks them
+_conventions = {'symbolsData': 'symbol', 'programmNamesData': 'programmName', 'namesData': 'name', 'pdgNamesData': 'pdgName'}
+
+
+def conjugate(ids: np.ndarray | int, database: ParticleDatabase = None) -> np.ndarray | int:
+    """
+    Maps particle IDs to the IDs of their anti particles, self conjugated particles like
+    the pi0 or K_S are mapped onto themselves, unknown IDs are negated as by the PDG convention
+    """
+    columns = getColumns(database)
+    array = np.asarray(ids)
+    index, found = columns.index(array)
+    antiParticles = np.where(found, columns['antiParticle'][index], -array).astype(array.dtype, copy=False)
+    if array.ndim == 0:
+        return antiParticles.item()
+    return antiParticles
+
+
+def _antiMarkerVariants(body: str) -> list[str]:
+    """
+    Adds or removes the different ways anti particles are marked, e.g., D~, D_bar, Dbar
+    """
+    if body.endswith('~'):
+        return [body[:-1]]
+    if '~' in body:
+        return [body.replace('~', '', 1)]
+    if '_bar' in body:
+        return [body.replace('_bar', '', 1)]
+    if 'bar' in body:
+        return [body.replace('bar', '', 1)]
+    return [body + '~', body + 'bar', body + '_bar']
+
+
+def _spellings(record: dict, convention: str) -> list[str]:
+    """
+    The ways the name of a particle is written in the table of a naming convention, the entry of the record first
+    """
+    name = record[_conventions[convention]]
+    if not name:
+        return []
+    if convention == 'pdgNamesData':
+        name = name + '~' if int(record['pdgID']) < 0 else name
+        return [name, name.lower()]
+    if convention == 'programmNamesData':
+        return [name, name.lower(), name.lower().replace('_', ''), name.lower().replace('_', ' ')]
+    return [name]
+
+
+def _candidates(token: str) -> list[str]:
+    """
+    All spellings of the charge conjugate of a name, flipping the charge comes first,
+    then toggling the anti marker in front of the charge or at the end of the name
+    """
+    match = _chargePattern.match(token)
+    body, charge = match['body'], match['charge']
+    flipped = _flippedCharges[charge] or ''
+    if not body:
+        body, flipped = token, ''
+
+    candidates = []
+    if charge in ('+', '-', '++', '--'):
+        candidates.append(body + flipped)
+    if 'plus' in token or 'minus' in token:
+        candidates.append(token.replace('plus', '\0').replace('minus', 'plus').replace('\0', 'minus'))
+    candidates += [variant + flipped for variant in _antiMarkerVariants(body)]
+    candidates += _antiMarkerVariants(token)
+    return candidates
+
+
+@lru_cache(maxsize=8)
+def _decayVocabulary(database: ParticleDatabase, version: int) -> frozenset[str]:
+    # the names used in the decay modes, which are not all known to the name conventions
+    vocabulary = set()
+    for key in database.data:
+        for mode in database.data[key]['decayModes']:
+            if isinstance(mode, dict):
+                vocabulary.add(mode['parent'])
+                vocabulary.update(mode['daughters'])
+    return frozenset(vocabulary)
+
+
+@lru_cache(maxsize=8)
+def _conventionNames(database: ParticleDatabase, version: int) -> dict[str, dict[str, str]]:
+    # the first name of every particle in the table of every convention, for entries of records the table doesn't know
+    names = {}
+    for convention in _conventions:
+        names[convention] = {}
+        for name, pdgID in getattr(database, convention).items():
+            names[convention].setdefault(str(pdgID), name)
+    return names
+
+
+class _TokenConjugator:
+    """
+    Conjugates particle names in the naming convention they were written in,
+    every name is only worked out once per database version
+    """
+    def __init__(self) -> None:
+        # the conjugated names together with the database version they belong to, replaced as a whole
+        self._cache = (None, {})
+
+    def _resolve(self, database: ParticleDatabase, token: str) -> str | None:
+        try:
+            identifier = database.findParticle(token)
+        except (KeyError, ValueError, TypeError, IndexError):
+            return None
+        # some names of the tables point to IDs without a record, e.g., g~
+        return identifier if identifier in database.data else None
+
+    def _convention(self, database: ParticleDatabase, token: str, identifier: str) -> str | None:
+        # the table the token was found in, names like D are in several tables for different particles
+        for convention in _conventions:
+            names = getattr(database, convention)
+            if token in names and str(names[token]) == identifier:
+                return convention
+        return None
+
+    def _conjugate(self, database: ParticleDatabase, token: str) -> str:
+        identifier = self._resolve(database, token)
+        if identifier is not None:
+            antiParticle = database.getAntiParticle(int(identifier))
+            if str(antiParticle) == identifier:
+                return token
+            if token.lstrip('-').isdigit():
+                return str(antiParticle)
+            convention = self._convention(database, token, identifier)
+            if convention is not None:
+                # the name of the anti particle from the same table, written the same way, e.g., in lower case
+                spellings = _spellings(database.data[identifier], convention)
+                antiSpellings = _spellings(database.data[str(antiParticle)], convention)
+                if antiSpellings:
+                    spelling = antiSpellings[spellings.index(token)] if token in spellings else antiSpellings[0]
+                    if self._resolve(database, spelling) == str(antiParticle):
+                        return spelling
+                spelling = _conventionNames(database, database.version)[convention].get(str(antiParticle))
+                if spelling is not None and self._resolve(database, spelling) == str(antiParticle):
+                    return spelling
+            for candidate in _candidates(token):
+                if self._resolve(database, candidate) == str(antiParticle):
+                    return candidate
+            return database.data[str(antiParticle)]['symbol']
+
+        # names that can't be looked up are checked against the names in the decay modes
+        vocabulary = _decayVocabulary(database, database.version)
+        candidates = _candidates(token)
+        for candidate in candidates:
+            if candidate in vocabulary or self._resolve(database, candidate) is not None:
+                return candidate
+        if _chargePattern.match(token)['charge'] in ('+', '-', '++', '--'):
+            return candidates[0]
+        # neutral names without a known partner are taken to be self conjugated
+        return token
+
+    def __call__(self, database: ParticleDatabase, token: str) -> str:
+        cacheKey = (id(database), database.version)
+        cachedKey, tokens = self._cache
+        if cacheKey != cachedKey:
+            tokens = {}
+            self._cache = (cacheKey, tokens)
+        if token not in tokens:
+            tokens[token] = self._conjugate(database, token)
+        return tokens[token]
+
+
+_conjugateToken = _TokenConjugator()
+
+
+def conjugateName(name: str, database: ParticleDatabase = None) -> str:
+    """
+    Returns the name of the anti particle, written in the same convention as the given name,
+    e.g., K- -> K+, D0 -> D~0, B_s0 -> B_sbar0, pi0 -> pi0
+    """
+    database = getDefaultDatabase() if database is None else database
+    return _conjugateToken(database, name)
+
+
+def conjugateDecay(descriptor: str, database: ParticleDatabase = None) -> str:
+    """
+    Conjugates every particle of a decay descriptor, e.g.,
+    'B0 -> [D- -> K+ pi- pi-] pi+' -> 'B~0 -> [D+ -> K- pi+ pi+] pi-'
+    """
+    database = getDefaultDatabase() if database is None else database
+
+    def replace(match: re.Match) -> str:
+        if match[0] in _descriptorTokens:
+            return match[0]
+        return _conjugateToken(database, match[0])
+
+    return _tokenPattern.sub(replace, descriptor)
+
+
+def conjugateDecayModes(decayModes: list, database: ParticleDatabase = None) -> list:
+    """
+    Conjugates a list of decay modes, either as stored in the database with parent,
+    probability and daughters or as plain lists of daughter names
+    """
+    database = getDefaultDatabase() if database is None else database
+    conjugated = []
+    for mode in decayModes:
+        if isinstance(mode, dict):
+            conjugated.append({
+                **mode,
+                'parent': _conjugateToken(database, mode['parent']),
+                'daughters': [_conjugateToken(database, daughter) for daughter in mode['daughters']]
+            })
+        elif isinstance(mode, (list, tuple)):
+            conjugated.append([_conjugateToken(database, daughter) for daughter in mode])
+        else:
+            # entries like 'No Data Available'
+            conjugated.append(mode)
+    return conjugated
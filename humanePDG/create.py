@@ -1,14 +1,14 @@
 from .elementary import Lepton, Quark, Boson
 from .composite import DiQuark, Baryon, Meson
-from .humane import __findParticle__
+from .database import ParticleDatabase, getDefaultDatabase
 from .particle import Particle
-from .data import compositeData, elementaryData
 
 
-def createParticle(identifier: str | int | float) -> Particle:
-    particleID = __findParticle__(identifier)
-    if particleID in compositeData:
-        kwargs = compositeData[particleID]
+def createParticle(identifier: str | int | float, database: ParticleDatabase = None) -> Particle:
+    database = getDefaultDatabase() if database is None else database
+    particleID = database.findParticle(identifier)
+    if particleID in database.compositeData:
+        kwargs = database.compositeData[particleID]
 
         if kwargs['particleType'] == 'meson':
             baseClass = Meson
@@ -20,8 +20,8 @@ def createParticle(identifier: str | int | float) -> Particle:
         newClass = type(kwargs['name'], (baseClass,), {})
         return newClass(**kwargs)
 
-    elif particleID in elementaryData:
-        kwargs = elementaryData[particleID]
+    elif particleID in database.elementaryData:
+        kwargs = database.elementaryData[particleID]
 
         if kwargs['particleType'] == 'boson':
             baseClass = Boson
@@ -1,21 +1,254 @@
+import os
 import json
+import sqlite3
+import hashlib
+import threading
+from pathlib import Path
+from functools import lru_cache
+from collections.abc import Mapping
 from importlib_resources import files, as_file
 
 
-def loadData(fileName):
+# the particle tables and the name conventions, with the file they are stored in
+particleFiles = {
+    'elementaryData': 'elementary.json',
+    'compositeData': 'composite.json',
+}
+nameFiles = {
+    'namesData': 'namesToIDs.json',
+    'pdgNamesData': 'pdgNameToIDs.json',
+    'programmNamesData': 'programmToIDs.json',
+    'codeData': 'codesToIDs.json',
+    'symbolsData': 'symbolsToIDs.json',
+}
+
+
+def loadData(fileName, directory=None):
+    """
+    Loads one json file, either the shipped one or the one in a user supplied data directory
+    """
+    if directory is not None:
+        with open(Path(directory) / fileName, 'r') as jsonFile:
+            return json.load(jsonFile)
     source = files('humanePDG.data').joinpath(fileName)
     with as_file(source) as f:
         with open(f, 'r') as jsonFile:
             return json.load(jsonFile)
 
 
-elementaryData = loadData('elementary.json')
-compositeData = loadData('composite.json')
-namesData = loadData('namesToIDs.json')
-pdgNamesData = loadData('pdgNameToIDs.json')
-programmNamesData = loadData('programmToIDs.json')
-codeData = loadData('codesToIDs.json')
-symbolsData = loadData('symbolsToIDs.json')
+def _sourceStamp(directory: str | Path = None) -> str:
+    """
+    A cheap fingerprint of the json files, used to tell if a generated
+    SQLite file is still up to date
+    """
+    stamps = []
+    for fileName in [*particleFiles.values(), *nameFiles.values()]:
+        if directory is not None:
+            stat = os.stat(Path(directory) / fileName)
+        else:
+            with as_file(files('humanePDG.data').joinpath(fileName)) as f:
+                stat = os.stat(f)
+        stamps.append(f'{fileName}:{stat.st_size}:{stat.st_mtime_ns}')
+    return ';'.join(stamps)
+
+
+def sqlitePath(directory: str | Path = None) -> Path:
+    """
+    The location of the generated SQLite file, for the shipped data it can be set with
+    the HUMANEPDG_SQLITE environment variable, otherwise it lives in the user cache
+    """
+    if directory is None and 'HUMANEPDG_SQLITE' in os.environ:
+        return Path(os.environ['HUMANEPDG_SQLITE'])
+    cacheDir = Path(os.environ.get('XDG_CACHE_HOME', Path.home() / '.cache')) / 'humanePDG'
+    if directory is None:
+        return cacheDir / 'particles.sqlite'
+    directoryHash = hashlib.sha1(str(Path(directory).resolve()).encode()).hexdigest()[:12]
+    return cacheDir / f'particles-{directoryHash}.sqlite'
+
+
+def buildSQLite(path: str | Path, directory: str | Path = None) -> Path:
+    """
+    Generates the SQLite file from the json files, the particles are
+    stored one row per particle and every name convention gets its own index
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    temporary = path.with_name(f'{path.name}.{os.getpid()}.tmp')
+
+    connection = sqlite3.connect(temporary)
+    try:
+        connection.executescript("""
+            CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+            CREATE TABLE particles (
+                pdgID INTEGER PRIMARY KEY,
+                source TEXT NOT NULL,
+                record TEXT NOT NULL
+            );
+            CREATE TABLE names (
+                convention TEXT NOT NULL,
+                alias TEXT NOT NULL,
+                pdgID
+            );
+            CREATE INDEX particlesSource ON particles (source, pdgID);
+        """)
+        for source, fileName in particleFiles.items():
+            connection.executemany(
+                'INSERT INTO particles (pdgID, source, record) VALUES (?, ?, ?)',
+                ((int(key), source, json.dumps(record)) for key, record in loadData(fileName, directory).items())
+            )
+        for convention, fileName in nameFiles.items():
+            connection.executemany(
+                'INSERT INTO names (convention, alias, pdgID) VALUES (?, ?, ?)',
+                ((convention, alias, pdgID) for alias, pdgID in loadData(fileName, directory).items())
+            )
+        connection.executescript("""
+            CREATE UNIQUE INDEX namesAlias ON names (convention, alias);
+            CREATE INDEX namesID ON names (pdgID);
+        """)
+        connection.execute("INSERT INTO meta VALUES ('sourceStamp', ?)", (_sourceStamp(directory),))
+        connection.commit()
+    finally:
+        connection.close()
+
+    os.replace(temporary, path)
+    return path
+
+
+def _ensureSQLite(path: str | Path = None, directory: str | Path = None) -> Path:
+    path = sqlitePath(directory) if path is None else Path(path)
+
+    stamp = None
+    if path.exists():
+        connection = sqlite3.connect(path.resolve().as_uri() + '?mode=ro', uri=True)
+        try:
+            stamp = connection.execute("SELECT value FROM meta WHERE key = 'sourceStamp'").fetchone()
+        except sqlite3.DatabaseError:
+            stamp = None
+        finally:
+            connection.close()
+
+    if stamp is None or stamp[0] != _sourceStamp(directory):
+        buildSQLite(path, directory)
+    return path
+
+
+class ThreadConnections:
+    """
+    Read-only connections to a SQLite file, one per thread, so queries
+    from different threads never share a connection or wait for each other.
+    The file gets (re)built first if it's missing or older than the json files
+    """
+    def __init__(self, path: str | Path = None, directory: str | Path = None) -> None:
+        self._uri = _ensureSQLite(path, directory).resolve().as_uri() + '?mode=ro'
+        self._local = threading.local()
+
+    def execute(self, sql: str, parameters: tuple = ()) -> sqlite3.Cursor:
+        connection = getattr(self._local, 'connection', None)
+        if connection is None:
+            connection = self._local.connection = sqlite3.connect(self._uri, uri=True)
+        return connection.execute(sql, parameters)
+
+
+class SQLiteParticles(Mapping):
+    """
+    A read-only dict like view on the particles of a SQLite file,
+    rows are only decoded when asked for and a few of them are kept in a LRU
+    """
+    def __init__(self, connection: sqlite3.Connection | ThreadConnections, source: str = None, cacheSize: int = 128) -> None:
+        self._connection = connection
+        self._source = source
+        self._fetch = lru_cache(maxsize=cacheSize)(self._fetchRow)
+
+    def _fetchRow(self, pdgID: int) -> dict:
+        if self._source is None:
+            row = self._connection.execute('SELECT record FROM particles WHERE pdgID = ?', (pdgID,)).fetchone()
+        else:
+            row = self._connection.execute('SELECT record FROM particles WHERE pdgID = ? AND source = ?', (pdgID, self._source)).fetchone()
+        return None if row is None else json.loads(row[0])
+
+    def __getitem__(self, key: str) -> dict:
+        try:
+            record = self._fetch(int(key))
+        except (TypeError, ValueError):
+            raise KeyError(key)
+        if record is None:
+            raise KeyError(key)
+        return record
+
+    def __iter__(self):
+        if self._source is None:
+            rows = self._connection.execute("SELECT pdgID FROM particles ORDER BY source = 'compositeData', pdgID")
+        else:
+            rows = self._connection.execute('SELECT pdgID FROM particles WHERE source = ? ORDER BY pdgID', (self._source,))
+        for (pdgID,) in rows.fetchall():
+            yield str(pdgID)
+
+    def __len__(self) -> int:
+        if self._source is None:
+            return self._connection.execute('SELECT COUNT(*) FROM particles').fetchone()[0]
+        return self._connection.execute('SELECT COUNT(*) FROM particles WHERE source = ?', (self._source,)).fetchone()[0]
+
+
+class SQLiteNames(Mapping):
+    """
+    A read-only dict like view on one name convention of a SQLite file,
+    mapping names to particle IDs through the index on that convention
+    """
+    def __init__(self, connection: sqlite3.Connection | ThreadConnections, convention: str, cacheSize: int = 256) -> None:
+        self._connection = connection
+        self._convention = convention
+        self._fetch = lru_cache(maxsize=cacheSize)(self._fetchRow)
+
+    def _fetchRow(self, alias: str) -> tuple:
+        return self._connection.execute('SELECT pdgID FROM names WHERE convention = ? AND alias = ?', (self._convention, alias)).fetchone()
+
+    def __getitem__(self, key: str) -> int | str:
+        if not isinstance(key, str):
+            raise KeyError(key)
+        row = self._fetch(key)
+        if row is None:
+            raise KeyError(key)
+        return row[0]
+
+    def __iter__(self):
+        rows = self._connection.execute('SELECT alias FROM names WHERE convention = ? ORDER BY rowid', (self._convention,))
+        for (alias,) in rows.fetchall():
+            yield alias
+
+    def __len__(self) -> int:
+        return self._connection.execute('SELECT COUNT(*) FROM names WHERE convention = ?', (self._convention,)).fetchone()[0]
+
+
+def loadTables(backend: str = 'json', directory: str | Path = None) -> dict[str, Mapping]:
+    """
+    Loads all particle tables and name conventions, either as plain dicts from
+    the json files or as lazy views on the generated SQLite file
+    """
+    if backend == 'json':
+        tables = {name: loadData(fileName, directory) for name, fileName in {**particleFiles, **nameFiles}.items()}
+        # I do this in order to merge all particle dicts
+        tables['particleData'] = {**tables['elementaryData'], **tables['compositeData']}
+    elif backend == 'sqlite':
+        connection = ThreadConnections(directory=directory)
+        tables = {name: SQLiteParticles(connection, name) for name in particleFiles}
+        tables.update({name: SQLiteNames(connection, name) for name in nameFiles})
+        tables['particleData'] = SQLiteParticles(connection)
+    else:
+        raise ValueError(f"Unknown backend {backend}, use 'json' or 'sqlite'.")
+    return tables
+
+
+backend = os.environ.get('HUMANEPDG_BACKEND', 'json').lower()
+tables = loadTables(backend)
+
+elementaryData = tables['elementaryData']
+compositeData = tables['compositeData']
+particleData = tables['particleData']
+namesData = tables['namesData']
+pdgNamesData = tables['pdgNamesData']
+programmNamesData = tables['programmNamesData']
+codeData = tables['codeData']
+symbolsData = tables['symbolsData']
 
 
-__all__ = ['elementaryData', 'compositeData', 'namesData', 'pdgNamesData', 'programmNamesData', 'codeData', 'symbolsData']
+__all__ = ['elementaryData', 'compositeData', 'particleData', 'namesData', 'pdgNamesData', 'programmNamesData', 'codeData', 'symbolsData']
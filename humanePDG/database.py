@@ -0,0 +1,533 @@
+import threading
+from collections import namedtuple, ChainMap
+from collections.abc import Mapping, Callable
+from pathlib import Path
+from .particle import Charge, SpinType, ParticleType
+from .data.loaddata import loadTables, particleFiles, nameFiles, tables as defaultTables
+
+
+# the result of comparing two databases, changed maps an ID to {field: (old, new)}
+DatabaseDiff = namedtuple('DatabaseDiff', ['added', 'removed', 'changed'])
+
+
+class ParticleDatabase:
+    """
+    All particle tables and name conventions of one PDG edition,
+    a database can be loaded from any directory containing the same json files
+    as the ones shipped with this package
+    """
+    def __init__(self, directory: str | Path = None, *, edition: str = None, backend: str = 'json', shareWith: 'ParticleDatabase' = None) -> None:
+        tables = loadTables(backend, directory)
+        shareWith = getDefaultDatabase() if shareWith is None else shareWith
+        if backend == 'json' and isinstance(shareWith.data, dict):
+            # entries that did not change between editions are shared with the other database
+            tables = _shareTables(tables, shareWith)
+        if edition is None:
+            edition = 'default' if directory is None else Path(directory).name
+        self._setTables(tables, edition)
+
+    @classmethod
+    def fromTables(cls, tables: dict[str, Mapping], edition: str = 'default') -> 'ParticleDatabase':
+        """
+        Wraps already loaded tables, as returned by loadTables, without copying them
+        """
+        database = cls.__new__(cls)
+        database._setTables(tables, edition)
+        return database
+
+    def _setTables(self, tables: dict[str, Mapping], edition: str) -> None:
+        self.edition = edition
+        # bumped on every change, so anything derived from the tables knows when it's stale
+        self._version = 0
+        self._listeners = ()
+        # only changes take the lock, lookups read the tables without it
+        self._lock = threading.RLock()
+        self.elementaryData = tables['elementaryData']
+        self.compositeData = tables['compositeData']
+        self.data = tables['particleData']
+        self.namesData = tables['namesData']
+        self.pdgNamesData = tables['pdgNamesData']
+        self.programmNamesData = tables['programmNamesData']
+        self.codeData = tables['codeData']
+        self.symbolsData = tables['symbolsData']
+
+    @property
+    def tables(self) -> dict[str, Mapping]:
+        return {
+            'elementaryData': self.elementaryData,
+            'compositeData': self.compositeData,
+            'particleData': self.data,
+            'namesData': self.namesData,
+            'pdgNamesData': self.pdgNamesData,
+            'programmNamesData': self.programmNamesData,
+            'codeData': self.codeData,
+            'symbolsData': self.symbolsData,
+        }
+
+    def __repr__(self) -> str:
+        return f'{type(self).__name__}(edition={self.edition!r}, particles={len(self.data)})'
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def addListener(self, listener: Callable[['ParticleDatabase', list[str]], None]) -> None:
+        """
+        Registers a function that is called with the database and the changed IDs,
+        whenever particles are added, changed or removed
+        """
+        with self._lock:
+            self._listeners = (*self._listeners, listener)
+
+    def removeListener(self, listener: Callable[['ParticleDatabase', list[str]], None]) -> None:
+        with self._lock:
+            listeners = list(self._listeners)
+            listeners.remove(listener)
+            self._listeners = tuple(listeners)
+
+    def _notify(self, changed: list[str]) -> None:
+        with self._lock:
+            self._version += 1
+            for listener in self._listeners:
+                listener(self, changed)
+
+    def __getitem__(self, particle: str | int | float) -> dict:
+        return self.data[self.findParticle(particle)]
+
+    def __contains__(self, particle: str | int | float) -> bool:
+        try:
+            self.findParticle(particle)
+        except (KeyError, ValueError, TypeError):
+            return False
+        return True
+
+    def __iter__(self):
+        return iter(self.data)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def findParticle(self, particle: str | int | float) -> str:
+        """
+        Handles the different types of particle identifiers, it's important to keep in mind,
+        the data is stored in dict, with pdg codes as identifiers, they are of type str,
+        because of the way how json loads the dicts.
+        """
+        # Going through different possibilities
+        if isinstance(particle, str):
+            if len(particle) == 1 and not particle.isdigit():
+                return str(self.pdgNamesData[particle[0]])
+            elif (len(particle) == 6 and particle.lower().endswith('meson')) or (len(particle) == 6 and particle.lower().endswith('boson')):
+                return str(self.pdgNamesData[particle[0]])
+
+            # If identifier is a PDG Code, e.g., 11, -211
+            elif particle.isdigit() or (particle.startswith('-') and particle[1:].isdigit()):
+                if str(int(particle)) in self.data:
+                    return str(int(particle))
+                else:
+                    raise ValueError(f"Particle ID {particle} not found.")
+
+            # If the identifier is a PDG ID, e.g., S000, names like B0 or D0 look the same
+            elif particle[0].isalpha() and particle[1].isdigit():
+                try:
+                    return str(self.codeData[particle])
+                except KeyError:
+                    try:
+                        return self._checkDicts(particle)
+                    except ValueError:
+                        raise KeyError(f"Particle Code {particle} not found.")
+
+            elif particle in self.pdgNamesData:
+                return str(self.pdgNamesData[particle])
+
+            # If the identifier is an MC ID, e.g., 211
+            else:
+                return self._checkDicts(particle)
+
+        # Checking the float and turning it into an int
+        elif isinstance(particle, float):
+            # turning float into an int
+            if particle.is_integer():
+                if str(int(particle)) in self.data:
+                    return str(int(particle))
+                else:
+                    raise ValueError(f"Particle ID {particle} not found.")
+            else:
+                raise ValueError("Float particle identifiers must be integer-valued, e.g., 211.0")
+
+        # Just return the identifier if it's already an integer
+        elif isinstance(particle, int):
+            if str(particle) in self.data:
+                return str(particle)
+            else:
+                raise ValueError(f"Particle ID {particle} not found.")
+        else:
+            raise TypeError('The particle identifier needs to be a name (str) or id (int, float)')
+
+    def _checkDicts(self, keyWord: str | int | float) -> str:
+        # Create a list of possible variations of the keyword
+        keyword_variations = [
+            keyWord,
+            str(keyWord).lower(),
+            str(keyWord).replace('_', ''),
+            str(keyWord).replace(' ', ''),
+            str(keyWord).replace('(', '_').replace(')', ''),
+            str(keyWord).replace('~', 'bar'),
+            str(keyWord).replace('~', '_bar'),
+            str(keyWord).replace('bar', '~'),
+            str(keyWord).replace('_bar', '~'),
+            str(keyWord).capitalize()
+        ]
+
+        # Check each variation against the dictionaries, the later conventions take precedence
+        for variation in keyword_variations:
+            for names in (self.symbolsData, self.programmNamesData, self.namesData, self.pdgNamesData):
+                if variation in names:
+                    return str(names[variation])
+
+        raise ValueError(f"Particle Name {keyWord} not found.")
+
+    def getParticle(self, particle: str | int) -> int | str:
+        """
+        Returns the name of a particle when give an ID
+        or it returns the ID under a given name of different conventions
+        """
+        identifier = self.findParticle(particle)
+        name = self.data[identifier]['name']
+        if isinstance(particle, (float, int)):
+            return name
+        elif isinstance(particle, str):
+            return int(identifier)
+        else:
+            raise TypeError(f'the type {type(particle)} is not supported, only floats, ints and strs')
+
+    def getAntiParticle(self, particle: str | int, returnType: str = 'id') -> int | str:
+        """
+        Returns the name of the anti particle when give an ID
+        or it returns the ID under a given name of different conventions
+        one can choose of an ID or name will be returned
+        """
+        identifier = self.findParticle(particle)
+        isSelfConjugate = self.data[identifier]['selfConjugated']
+
+        antiParticle = int(identifier) if isSelfConjugate else -int(identifier)
+
+        if returnType == 'id':
+            return antiParticle
+        return self.data[str(antiParticle)]['name']
+
+    def isSelfConjugate(self, particle: str | int) -> bool:
+        """
+        Returns if a particle is self conjugated
+        """
+        identifier = self.findParticle(particle)
+        return self.data[identifier]['selfConjugated']
+
+    def getDecayMode(self, particle: str | int) -> list[str]:
+        """
+        Returns the decay modes of any given particle
+        """
+        identifier = self.findParticle(particle)
+        return self.data[identifier]['decayModes']
+
+    def getDecayWidth(self, particle: str | int, returnError: bool = False) -> tuple[float]:
+        """
+        Returns the decay with of any given particle
+        optionally it can return the error as well
+        """
+        identifier = self.findParticle(particle)
+        if returnError is True:
+            return (self.data[identifier]['width'], self.data[identifier]['widthUpper'], self.data[identifier]['widthLower'])
+        return (self.data[identifier]['width'])
+
+    def getMass(self, particle: str | int, returnError: bool = False) -> tuple[float]:
+        """
+        Returns the mass of any given particle
+        optionally it can return the error as well
+        """
+        identifier = self.findParticle(particle)
+        if returnError is True:
+            return (self.data[identifier]['mass'], self.data[identifier]['massLower'], self.data[identifier]['massUpper'])
+        return (self.data[identifier]['mass'])
+
+    def getLifetime(self, particle: str | int) -> float:
+        """
+        Returns the lifetime of any given particle
+        """
+        identifier = self.findParticle(particle)
+        return self.data[identifier]['lifetime']
+
+    def getCharge(self, particle: str | int) -> Charge:
+        """
+        Returns the charge of any given particle
+        """
+        identifier = self.findParticle(particle)
+        return Charge.set(self.data[identifier]['charge'])
+
+    def getQuarks(self, particle: str | int) -> list[str]:
+        """
+        Returns the quark content of any given particle
+        """
+        identifier = self.findParticle(particle)
+        if self.data[identifier]['particleType'] in ('boson', 'lepton'):
+            raise Warning(f'{particle} does not contain quarks')
+        elif self.data[identifier]['particleType'] == 'quark':
+            return [self.data[identifier]['symbol']]
+        return self.data[identifier]['quarks']
+
+    def getSpinType(self, particle: str | int) -> SpinType:
+        """
+        Returns the spin type of any given particle
+        """
+        identifier = self.findParticle(particle)
+        return SpinType(self.data[identifier]['spinType'])
+
+    def getParticleType(self, particle: str | int) -> ParticleType:
+        """
+        Returns the particle type of any given particle
+        """
+        identifier = self.findParticle(particle)
+        return ParticleType(self.data[identifier]['particleType'])
+
+    def isQuark(self, particle: str | int) -> bool:
+        """
+        Returns if any given particle is a quark
+        """
+        return self.data[self.findParticle(particle)]['particleType'] == 'quark'
+
+    def isLepton(self, particle: str | int) -> bool:
+        """
+        Returns if any given particle is a lepton
+        """
+        return self.data[self.findParticle(particle)]['particleType'] == 'lepton'
+
+    def isBoson(self, particle: str | int) -> bool:
+        """
+        Returns if any given particle is a gauge boson
+        """
+        return self.data[self.findParticle(particle)]['particleType'] == 'boson'
+
+    def isMeson(self, particle: str | int) -> bool:
+        """
+        Returns if any given particle is a meson
+        """
+        return self.data[self.findParticle(particle)]['particleType'] == 'meson'
+
+    def isBaryon(self, particle: str | int) -> bool:
+        """
+        Returns if any given particle is a baryon
+        """
+        return self.data[self.findParticle(particle)]['particleType'] == 'baryon'
+
+    def listNames(self) -> list[str]:
+        """
+        Lists all names that can be imported
+        """
+        return [self.data[id]['name'] for id in self.data]
+
+    def listIDs(self) -> list[int]:
+        """
+        Lists all particle Monte Carlo IDs
+        """
+        return list(self.data.keys())
+
+    def listPDGNames(self) -> list[str]:
+        """
+        Lists all pdg names that can be imported
+        """
+        return [self.data[id]['pdgName'] for id in self.data]
+
+    def diff(self, other: 'ParticleDatabase') -> DatabaseDiff:
+        """
+        Compares the particles of this database with the ones of another one,
+        entries shared between both are skipped without looking at their fields
+        """
+        if self.data is other.data:
+            return DatabaseDiff(added=[], removed=[], changed={})
+
+        added = [key for key in other.data if key not in self.data]
+        removed = [key for key in self.data if key not in other.data]
+        changed = {}
+        for key in self.data:
+            if key not in other.data:
+                continue
+            old, new = self.data[key], other.data[key]
+            if old is new or old == new:
+                continue
+            fields = {}
+            for field in old.keys() | new.keys():
+                if old.get(field) != new.get(field):
+                    fields[field] = (old.get(field), new.get(field))
+            changed[key] = fields
+        return DatabaseDiff(added=added, removed=removed, changed=changed)
+
+
+def _shareRecord(record: dict, baseRecord: dict | None) -> dict:
+    """
+    Returns the record of the base database if both are equal, otherwise
+    the unchanged fields of the new record point to the objects of the base one
+    """
+    if baseRecord is None:
+        return record
+    if record == baseRecord:
+        return baseRecord
+    return {field: baseRecord[field] if field in baseRecord and baseRecord[field] == value else value for field, value in record.items()}
+
+
+def _shareTables(tables: dict[str, Mapping], base: 'ParticleDatabase') -> dict[str, Mapping]:
+    """
+    Replaces everything in freshly loaded tables that did not change compared to a base database
+    by the objects of the base database, so two editions only pay for their differences
+    """
+    baseTables = base.tables
+    shared = {}
+    for name in particleFiles:
+        baseTable = baseTables[name]
+        if tables[name] == baseTable:
+            shared[name] = baseTable
+        else:
+            shared[name] = {key: _shareRecord(record, baseTable.get(key)) for key, record in tables[name].items()}
+
+    for name in nameFiles:
+        baseTable = baseTables[name]
+        if tables[name] == baseTable:
+            shared[name] = baseTable
+        else:
+            # the name strings are shared, even if the IDs behind them changed
+            baseKeys = {key: key for key in baseTable}
+            shared[name] = {baseKeys.get(key, key): value for key, value in tables[name].items()}
+
+    if shared['elementaryData'] is baseTables['elementaryData'] and shared['compositeData'] is baseTables['compositeData']:
+        shared['particleData'] = baseTables['particleData']
+    else:
+        # I do this in order to merge all particle dicts
+        shared['particleData'] = {**shared['elementaryData'], **shared['compositeData']}
+    return shared
+
+
+# the fields every particle has, used for filling up newly registered particles
+_recordTemplate = {
+    'name': None, 'pdgID': None, 'pdgCode': None, 'pdg_dict_name': None,
+    'decayModes': ['No Data Available'], 'symbol': None, 'pdgName': None, 'programmName': None,
+    'charge': None, 'mass': None, 'massLower': None, 'massUpper': None, 'quarks': '',
+    'selfConjugated': False, 'lifetime': None, 'width': None, 'widthLower': None, 'widthUpper': None,
+    'angularMomentum': None, 'spinType': None, 'particleType': None, 'unicode': None,
+    'isoSpin': None, 'chargeConjugate': None, 'paritySymmetry': None,
+}
+_compositeTypes = ('meson', 'baryon', 'diquark')
+
+
+class ParticleOverlay(ParticleDatabase):
+    """
+    Custom or corrected particles layered on top of another database,
+    every table is a ChainMap, so the base database is neither copied nor changed
+    and registering a particle only touches the entries belonging to it
+    """
+    def __init__(self, base: ParticleDatabase = None, *, edition: str = None) -> None:
+        self.base = getDefaultDatabase() if base is None else base
+        tables = {name: ChainMap({}, table) for name, table in self.base.tables.items()}
+        self._setTables(tables, f'{self.base.edition}+overlay' if edition is None else edition)
+        # the name entries each registered particle added, so they can be removed again
+        self._aliases = {}
+
+    @property
+    def version(self) -> int:
+        # changes of the base database make everything derived from the overlay stale as well
+        return self._version + self.base.version
+
+    def register(self, record: dict) -> str:
+        """
+        Adds a particle or overrides an existing one, a correction only needs the pdgID
+        and the changed fields, everything else is taken from the base entry.
+        The particle can then be found under its name, pdgName, programmName, symbol and pdgCode
+        """
+        if 'pdgID' not in record:
+            raise KeyError('a particle needs at least a pdgID to be registered')
+        with self._lock:
+            return self._register(record)
+
+    def _register(self, record: dict) -> str:
+        key = str(int(record['pdgID']))
+        previous = self.data.get(key)
+        record = {**(_recordTemplate if previous is None else previous), **record, 'pdgID': int(key)}
+        if record['particleType'] is None:
+            raise ValueError(f'the particle {key} needs a particleType')
+        table = 'compositeData' if record['particleType'] in _compositeTypes else 'elementaryData'
+        # the entry of the base database would still be found in the other table, so it can't be moved
+        if previous is not None and (previous['particleType'] in _compositeTypes) != (table == 'compositeData'):
+            raise ValueError(f"the particle {key} is a {previous['particleType']} and can't be changed into a {record['particleType']}")
+        if record['unicode'] is None:
+            record['unicode'] = record['symbol']
+
+        if key in self._aliases:
+            self._removeAliases(key)
+        self.tables[table].maps[0][key] = record
+        self.data.maps[0][key] = record
+
+        aliases = []
+        if record['name']:
+            aliases.append(('namesData', record['name'], int(key)))
+        if record['pdgName']:
+            pdgName = record['pdgName'] if int(key) > 0 else record['pdgName'] + '~'
+            aliases += [('pdgNamesData', pdgName, int(key)), ('pdgNamesData', pdgName.lower(), int(key))]
+        if record['programmName']:
+            programmName = record['programmName']
+            aliases += [
+                ('programmNamesData', programmName, int(key)),
+                ('programmNamesData', programmName.lower(), int(key)),
+                ('programmNamesData', programmName.lower().replace('_', ''), int(key)),
+                ('programmNamesData', programmName.lower().replace('_', ' '), int(key)),
+            ]
+        if record['symbol']:
+            aliases.append(('symbolsData', record['symbol'], key))
+        if record['pdgCode']:
+            aliases.append(('codeData', record['pdgCode'], abs(int(key))))
+
+        for tableName, alias, value in aliases:
+            self.tables[tableName].maps[0][alias] = value
+        self._aliases[key] = [(tableName, alias) for tableName, alias, _ in aliases]
+
+        self._notify([key])
+        return key
+
+    def unregister(self, particle: str | int | float) -> None:
+        """
+        Removes a registered particle, an overridden particle falls back to its base entry
+        """
+        with self._lock:
+            key = self.findParticle(particle)
+            if key not in self._aliases:
+                raise KeyError(f'Particle {particle} was not registered in this overlay.')
+            self._removeAliases(key)
+            for table in ('elementaryData', 'compositeData', 'particleData'):
+                self.tables[table].maps[0].pop(key, None)
+            self._notify([key])
+
+    def _removeAliases(self, key: str) -> None:
+        tables = self.tables
+        for tableName, alias in self._aliases.pop(key):
+            tables[tableName].maps[0].pop(alias, None)
+
+    @property
+    def registered(self) -> list[str]:
+        return list(self._aliases)
+
+
+_defaultDatabase = ParticleDatabase.fromTables(defaultTables)
+
+
+def getDefaultDatabase() -> ParticleDatabase:
+    """
+    Returns the database that the module level functions are looking particles up in
+    """
+    return _defaultDatabase
+
+
+def setDefaultDatabase(database: ParticleDatabase) -> None:
+    """
+    Changes the database that the module level functions are looking particles up in
+    """
+    global _defaultDatabase
+    if not isinstance(database, ParticleDatabase):
+        raise TypeError(f'expected a ParticleDatabase, got {type(database)}')
+    _defaultDatabase = database
@@ -0,0 +1,197 @@
+import re
+import math
+from collections import namedtuple
+from functools import lru_cache
+from .database import ParticleDatabase, getDefaultDatabase
+from .conjugation import conjugate
+from .laws import DecayCache, conservationLaws
+
+
+_tokenPattern = re.compile(r'\[|\]|->|[^\s\[\]]+')
+_arrows = {'->', '-->', '=>'}
+_chargeConjugates = {'cc', 'CC'}
+
+# a particle of a compiled descriptor, daughters is None if its decay is left open,
+# otherwise daughterIDs holds the sorted IDs of the daughters for comparing final states quickly
+DecayNode = namedtuple('DecayNode', ['pdgID', 'daughters', 'daughterIDs'])
+
+
+def _node(pdgID: int, daughters: tuple | None) -> DecayNode:
+    if daughters is None:
+        return DecayNode(pdgID, None, None)
+    return DecayNode(pdgID, daughters, tuple(sorted(d.pdgID for d in daughters)))
+
+
+def _conjugateNode(node: DecayNode, database: ParticleDatabase) -> DecayNode:
+    daughters = None if node.daughters is None else tuple(_conjugateNode(d, database) for d in node.daughters)
+    return _node(conjugate(node.pdgID, database), daughters)
+
+
+def _matchNode(node: DecayNode, tree: tuple) -> bool:
+    pdgID, daughters = tree
+    if pdgID != node.pdgID:
+        return False
+    if node.daughters is None:
+        return True
+    if tuple(sorted(d[0] for d in daughters)) != node.daughterIDs:
+        return False
+    # only the daughters with a given decay need to be assigned to the daughters of the tree
+    return _assign([d for d in node.daughters if d.daughters is not None], list(daughters))
+
+
+def _assign(nodes: list[DecayNode], trees: list[tuple]) -> bool:
+    if not nodes:
+        return True
+    node, rest = nodes[0], nodes[1:]
+    for i, tree in enumerate(trees):
+        if _matchNode(node, tree) and _assign(rest, trees[:i] + trees[i + 1:]):
+            return True
+    return False
+
+
+class DecayDescriptor(namedtuple('DecayDescriptor', ['descriptor', 'root', 'chargeConjugate', 'conjugateRoot', 'violations'])):
+    """
+    A compiled decay descriptor, an immutable tree of PDG IDs.
+    violations lists the decays in it that break a conservation law or the mass threshold
+    """
+    __slots__ = ()
+
+    @property
+    def isValid(self) -> bool:
+        return not self.violations
+
+    def matches(self, tree: tuple) -> bool:
+        """
+        Tests a decay tree of an event, given as (pdgID, [daughter trees]), e.g.,
+        (421, [(-321, []), (211, [])]), against the descriptor and with cc its charge conjugate
+        """
+        if _matchNode(self.root, tree):
+            return True
+        return self.chargeConjugate and _matchNode(self.conjugateRoot, tree)
+
+    def __repr__(self) -> str:
+        return f'DecayDescriptor({self.descriptor!r})'
+
+
+class _Parser:
+    """
+    A recursive descent parser for descriptors like 'B0 -> [D- -> K+ pi- pi-] pi+ cc'
+    """
+    def __init__(self, descriptor: str, database: ParticleDatabase) -> None:
+        self.descriptor = descriptor
+        self.tokens = _tokenPattern.findall(descriptor)
+        self.position = 0
+        self.database = database
+        self.particles = {}
+
+    def _peek(self) -> str | None:
+        return self.tokens[self.position] if self.position < len(self.tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise ValueError(f'Unexpected end of the decay descriptor {self.descriptor!r}.')
+        self.position += 1
+        return token
+
+    def _expect(self, expected: str) -> None:
+        token = self._peek()
+        if token != expected:
+            found = 'the end' if token is None else repr(token)
+            raise ValueError(f'Expected {expected!r} in the decay descriptor {self.descriptor!r}, got {found}.')
+        self.position += 1
+
+    def _particle(self, token: str) -> int:
+        if token in _arrows or token in _chargeConjugates or token in '[]':
+            raise ValueError(f'Expected a particle in {self.descriptor!r}, got {token!r}.')
+        if token not in self.particles:
+            try:
+                self.particles[token] = int(self.database.findParticle(token))
+            except (KeyError, ValueError, IndexError) as error:
+                raise ValueError(f'Unknown particle {token!r} in the decay descriptor {self.descriptor!r}.') from error
+        return self.particles[token]
+
+    def _decay(self, closing: str | None) -> DecayNode:
+        parent = self._particle(self._next())
+        arrow = self._next()
+        if arrow not in _arrows:
+            raise ValueError(f'Expected -> after the parent in {self.descriptor!r}, got {arrow!r}.')
+
+        daughters = []
+        while self._peek() not in (closing, None) and self._peek() not in _chargeConjugates:
+            token = self._next()
+            if token == '[':
+                daughters.append(self._decay(']'))
+                self._expect(']')
+            else:
+                daughters.append(_node(self._particle(token), None))
+        if not daughters:
+            raise ValueError(f'The decay of {parent} has no daughters in {self.descriptor!r}.')
+        return _node(parent, tuple(daughters))
+
+    def parse(self) -> tuple[DecayNode, bool]:
+        if self._peek() == '[':
+            self._next()
+            root = self._decay(']')
+            self._expect(']')
+        else:
+            root = self._decay(None)
+
+        chargeConjugate = False
+        if self._peek() in _chargeConjugates:
+            self._next()
+            chargeConjugate = True
+        if self._peek() is not None:
+            raise ValueError(f'Unexpected {self._peek()!r} in the decay descriptor {self.descriptor!r}.')
+        return root, chargeConjugate
+
+
+def _violations(node: DecayNode, database: ParticleDatabase, decayCache: DecayCache) -> list[str]:
+    if node.daughters is None:
+        return []
+    violations = []
+    result = decayCache(node.pdgID, node.daughterIDs)
+    if not result.isPermited:
+        violations.append(f'{node.pdgID} -> {node.daughterIDs}: {result.reason}')
+
+    masses = [database.data[str(pdgID)]['mass'] for pdgID in (node.pdgID, *node.daughterIDs)]
+    if all(mass is not None and not math.isnan(mass) for mass in masses) and sum(masses[1:]) > masses[0]:
+        violations.append(f'{node.pdgID} -> {node.daughterIDs}: the daughters are heavier than the parent ({sum(masses[1:])} > {masses[0]} MeV)')
+
+    for daughter in node.daughters:
+        violations += _violations(daughter, database, decayCache)
+    return violations
+
+
+@lru_cache(maxsize=1024)
+def _compile(descriptor: str, database: ParticleDatabase, version: int, laws: tuple) -> DecayDescriptor:
+    root, chargeConjugate = _Parser(descriptor, database).parse()
+    # the checks get their own cache, so they don't push the decays of the user out of the shared one
+    violations = tuple(_violations(root, database, DecayCache(maxSize=64, laws=dict(laws), database=database)))
+    conjugateRoot = _conjugateNode(root, database) if chargeConjugate else None
+    return DecayDescriptor(descriptor, root, chargeConjugate, conjugateRoot, violations)
+
+
+def compileDescriptor(descriptor: str, database: ParticleDatabase = None, strict: bool = False, laws: dict = None) -> DecayDescriptor:
+    """
+    Compiles a decay descriptor like 'B0 -> [D- -> K+ pi- pi-] pi+ cc' once into a tree of PDG IDs,
+    the compiled descriptors are cached by their string. The decays are checked against the laws,
+    by default those of conservationLaws. With strict, descriptors violating a conservation law
+    or a mass threshold raise a ValueError
+    """
+    database = getDefaultDatabase() if database is None else database
+    laws = conservationLaws if laws is None else laws
+    # the laws are part of the key, so changing them doesn't return the violations of the old ones
+    compiled = _compile(descriptor, database, database.version, tuple(laws.items()))
+    if strict and compiled.violations:
+        raise ValueError(f'The decay descriptor {descriptor!r} is not allowed: ' + '; '.join(compiled.violations))
+    return compiled
+
+
+def matchDecay(descriptor: str | DecayDescriptor, tree: tuple) -> bool:
+    """
+    Tests an event decay tree, given as (pdgID, [daughter trees]), against a descriptor
+    """
+    if isinstance(descriptor, str):
+        descriptor = compileDescriptor(descriptor)
+    return descriptor.matches(tree)
@@ -3,9 +3,6 @@ from importlib_resources import files, as_file
 from .data import elementaryData
 
 
-__all__ = []
-
-
 class Quark(Particle):
     def __init__(self, *args, **kwargs):
         super().__init__(*args, **kwargs)
@@ -30,24 +27,32 @@ class Boson(Particle):
         self.spinType = SpinType.FULL
 
 
-# Dynamically create classes and instances based on the data
-for key in elementaryData:
-    name = elementaryData[key]['name']
-    kwargs = elementaryData[key]
+# the particle classes are created on first import, not when loading the module
+_baseClasses = {'boson': Boson, 'lepton': Lepton, 'quark': Quark}
+_classNames = None
+
+
+def _importNames() -> dict[str, str]:
+    """
+    Maps every importable name to the ID of its particle
+    """
+    global _classNames
+    if _classNames is None:
+        _classNames = {elementaryData[key]['name']: key for key in elementaryData}
+    return _classNames
+
 
-    if elementaryData[key]['particleType'] == 'boson':
-        baseClass = Boson
-    elif elementaryData[key]['particleType'] == 'lepton':
-        baseClass = Lepton
-    elif elementaryData[key]['particleType'] == 'quark':
-        baseClass = Quark
+def __getattr__(name: str):
+    if name == '__all__':
+        return list(_importNames())
+    if name not in _importNames():
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
-    # Create the new class
-    newClass = type(name, (baseClass,), {})
+    kwargs = elementaryData[_importNames()[name]]
+    newClass = type(name, (_baseClasses[kwargs['particleType']],), {})
+    # Create an instance and store it in globals, a thread that created one at the same time gets the one stored first
+    return globals().setdefault(name, newClass(**kwargs))
 
-    # Check for name collisions
-    if name in globals():
-        print(f"Warning: A class named {name} already exists.")
 
-    globals()[name] = newClass(**kwargs)  # Create an instance and store it in globals
-    __all__.append(name)
+def __dir__() -> list[str]:
+    return [*globals(), *_importNames()]
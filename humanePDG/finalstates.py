@@ -0,0 +1,133 @@
+import math
+import numpy as np
+from .database import ParticleDatabase, getDefaultDatabase
+from .columns import getColumns, particleTypes
+from .create import createParticle
+from .laws import (
+    conservationLaws, checkDecay, chargeConversation, isoSpinConservation,
+    baryonNumberConservation, leptonNumberConservation
+)
+
+
+# particles that decay within 10 ps, in ns as the lifetimes, don't leave the interaction region
+longLivedLifetime = 0.01
+
+# free quarks, diquarks and gluons can't be in a final state
+_finalStateTypes = tuple(particleTypes.index(t) for t in ('meson', 'baryon', 'lepton', 'boson'))
+_gluon = 21
+_neutrinos = (12, 14, 16)
+
+# the laws that are sums over the particles, they are checked while the final states are built
+_additiveLaws = {
+    chargeConversation: 'charge',
+    isoSpinConservation: 'isoSpin',
+    baryonNumberConservation: 'baryonNumber',
+    leptonNumberConservation: 'leptonNumber',
+}
+_scales = {'charge': 3, 'isoSpin': 2, 'baryonNumber': 1, 'leptonNumber': 1}
+
+
+def _quantities(table: np.ndarray) -> dict[str, np.ndarray]:
+    # everything as integers, so the sums can be compared exactly: charges in thirds and isospins in halves
+    sign = np.sign(table['pdgID'])
+    return {
+        'charge': np.rint(3 * table['charge']).astype(np.int64),
+        'isoSpin': np.rint(2 * np.nan_to_num(table['isoSpin'])).astype(np.int64),
+        'baryonNumber': np.where(table['particleType'] == particleTypes.index('baryon'), sign, 0),
+        'leptonNumber': np.where(table['particleType'] == particleTypes.index('lepton'), sign, 0),
+    }
+
+
+def _candidates(database: ParticleDatabase, minLifetime: float | None) -> tuple[np.ndarray, dict[str, np.ndarray]]:
+    table = getColumns(database).table
+    # the masses of the neutrinos are unknown, they count as massless
+    mass = np.where(np.isin(np.abs(table['pdgID']), _neutrinos) & np.isnan(table['mass']), 0.0, table['mass'])
+
+    selected = np.isin(table['particleType'], _finalStateTypes) & (table['pdgID'] != _gluon) & ~np.isnan(mass)
+    if minLifetime is not None:
+        selected &= np.nan_to_num(table['lifetime']) >= minLifetime
+
+    order = np.argsort(mass[selected], kind='stable')
+    candidates = table[selected][order]
+    columns = _quantities(candidates)
+    columns['mass'] = mass[selected][order]
+    return candidates['pdgID'], columns
+
+
+def _search(columns: dict, quantities: list[str], targets: dict, bounds: dict, maxMass: float,
+            start: int, left: int, mass: float, sums: dict, chosen: list[int]):
+    """
+    Adds the particles of the final state one after the other, in the order of their mass,
+    every step only keeps the candidates that still allow reaching the targets with the particles left
+    """
+    masses = columns['mass']
+    # the particles after this one are at least as heavy as it
+    end = np.searchsorted(masses, (maxMass - mass) / left, side='left')
+    if end <= start:
+        return
+    allowed = np.ones(end - start, dtype=bool)
+    for name in quantities:
+        low, high = bounds[name]
+        value = sums[name] + columns[name][start:end]
+        allowed &= (value + (left - 1) * low <= targets[name]) & (targets[name] <= value + (left - 1) * high)
+
+    for i in (start + np.flatnonzero(allowed)).tolist():
+        chosen.append(i)
+        if left == 1:
+            yield tuple(chosen)
+        else:
+            yield from _search(
+                columns, quantities, targets, bounds, maxMass, i, left - 1, mass + masses[i],
+                {name: sums[name] + int(columns[name][i]) for name in quantities}, chosen
+            )
+        chosen.pop()
+
+
+def finalStates(parent: str | int = None, bodies: tuple[int] = (2, 3, 4), *, mass: float = None, charge: float = None,
+                baryonNumber: int = None, leptonNumber: int = None, isoSpin: float = None, longLived: bool = False,
+                minLifetime: float = None, laws: dict = None, database: ParticleDatabase = None):
+    """
+    Yields the final states with the given numbers of particles a parent can decay into, as tuples of PDG IDs.
+    The daughters have to be lighter than the parent together and fulfill the conservation laws,
+    by default those of conservationLaws. Instead of a parent its mass and quantum numbers can be given,
+    a missing isospin is then not checked. With longLived, only daughters living longer than
+    longLivedLifetime are used, minLifetime sets another limit in ns
+    """
+    database = getDefaultDatabase() if database is None else database
+    laws = conservationLaws if laws is None else laws
+    bodies = tuple(bodies)
+    if any(n < 1 for n in bodies):
+        raise ValueError(f'A final state needs at least one particle, got bodies={bodies}.')
+
+    given = {'charge': charge, 'isoSpin': isoSpin, 'baryonNumber': baryonNumber, 'leptonNumber': leptonNumber}
+    targets = {name: None if value is None else round(_scales[name] * value) for name, value in given.items()}
+    if parent is not None:
+        pdgID = int(database.findParticle(int(parent) if isinstance(parent, np.integer) else parent))
+        columns = getColumns(database)
+        row = columns.table[columns.index([pdgID])[0]]
+        parentValues = _quantities(row)
+        targets = {name: int(parentValues[name][0]) if value is None else value for name, value in targets.items()}
+        mass = float(row['mass'][0]) if mass is None else mass
+    elif mass is None:
+        raise ValueError('Either a parent or a mass has to be given.')
+    else:
+        targets = {name: 0 if value is None and name != 'isoSpin' else value for name, value in targets.items()}
+    if math.isnan(mass):
+        raise ValueError(f'The mass of {parent} is unknown.')
+
+    quantities = [_additiveLaws[law] for law in laws.values() if law in _additiveLaws and targets[_additiveLaws[law]] is not None]
+    otherLaws = {name: law for name, law in laws.items() if law not in _additiveLaws}
+    if otherLaws and parent is None:
+        raise ValueError(f"The laws {', '.join(otherLaws)} can only be checked for a parent particle.")
+
+    minLifetime = longLivedLifetime if longLived and minLifetime is None else minLifetime
+    pdgIDs, columns = _candidates(database, minLifetime)
+    bounds = {name: (int(columns[name].min(initial=0)), int(columns[name].max(initial=0))) for name in quantities}
+    parentParticle = createParticle(pdgID, database) if otherLaws else None
+
+    for n in bodies:
+        for chosen in _search(columns, quantities, targets, bounds, mass, 0, n, 0.0, dict.fromkeys(quantities, 0), []):
+            daughters = tuple(pdgIDs[list(chosen)].tolist())
+            if otherLaws and not checkDecay(parentParticle, [createParticle(d, database) for d in daughters], otherLaws).isPermited:
+                continue
+            yield daughters
@@ -0,0 +1,131 @@
+import re
+import numpy as np
+from .database import ParticleDatabase, getDefaultDatabase
+
+
+# the names in symbols that are written as greek letters in LaTeX
+_greekLetters = {
+    'alpha', 'beta', 'gamma', 'delta', 'epsilon', 'zeta', 'eta', 'theta', 'kappa', 'lambda',
+    'mu', 'nu', 'xi', 'pi', 'rho', 'sigma', 'tau', 'upsilon', 'phi', 'chi', 'psi', 'omega'
+}
+_symbolPattern = re.compile(r"^(?P<base>\([a-z]+\)|[A-Za-z]+(?:/[A-Za-z]+)?)(?P<rest>.*?)(?P<anti>~)?(?P<charge>\+\+|--|\+|-|0)?$")
+_decorationPattern = re.compile(r"\([^()]*\)|\*|'")
+
+
+def _latexName(name: str) -> str:
+    """
+    Turns greek names into LaTeX commands, e.g., pi -> \\pi, Lambda -> \\Lambda, J/psi -> J/\\psi
+    """
+    return re.sub(r'[A-Za-z]+', lambda match: '\\' + match[0] if match[0].lower() in _greekLetters else match[0], name)
+
+
+def latexLabel(symbol: str) -> str:
+    """
+    Generates a LaTeX label from a particle symbol, e.g., D*(2010)+ -> $D^{*}(2010)^{+}$,
+    Lambda(c)~- -> $\\bar{\\Lambda}_{c}^{-}$, the result can be used directly in matplotlib
+    """
+    match = _symbolPattern.match(symbol)
+    if match is None:
+        return f'${symbol}$'
+
+    label = _latexName(match['base'])
+    if match['anti']:
+        label = f'\\overline{{{label}}}' if label.startswith('(') else f'\\bar{{{label}}}'
+
+    subscript = ''
+    superscript = ''
+    suffix = ''
+    for decoration in _decorationPattern.findall(match['rest']):
+        if decoration in ('*', "'"):
+            # stars and primes before a mass go on top of the name, otherwise they're merged with the charge
+            superscript += '*' if decoration == '*' else '\\prime'
+        elif re.fullmatch(r'\(\d{3,}\)|\(\d[SPD]\)', decoration):
+            if superscript:
+                suffix += f'^{{{superscript}}}'
+                superscript = ''
+            suffix += decoration
+        elif not subscript and not suffix:
+            subscript = _latexName(decoration[1:-1])
+        else:
+            suffix += decoration
+
+    if match['charge']:
+        superscript += match['charge']
+
+    label += f'_{{{subscript}}}' if subscript else ''
+    label += suffix
+    label += f'^{{{superscript}}}' if superscript else ''
+    return f'${label}$'
+
+
+class LabelFormatter:
+    """
+    Turns arrays of particle IDs into labels for plots, every distinct ID is only
+    looked up once and the labels are kept per ID, so the cost does not grow with the number of entries.
+    The style can be any of 'unicode', 'symbol', 'pdgName', 'name' or 'latex'
+    """
+    styles = ('unicode', 'symbol', 'pdgName', 'name', 'latex')
+
+    def __init__(self, style: str = 'unicode', database: ParticleDatabase = None) -> None:
+        if style not in self.styles:
+            raise ValueError(f"Unknown label style {style}, use one of {', '.join(self.styles)}.")
+        self.style = style
+        self._database = database
+        # the labels together with the database version they belong to, replaced as a whole
+        self._cache = (None, {})
+
+    @property
+    def database(self) -> ParticleDatabase:
+        return getDefaultDatabase() if self._database is None else self._database
+
+    def _labels(self, database: ParticleDatabase) -> dict[int, str]:
+        # the cached labels are dropped, when the database was changed or swapped
+        cacheKey = (id(database), database.version)
+        cachedKey, labels = self._cache
+        if cacheKey != cachedKey:
+            labels = {}
+            self._cache = (cacheKey, labels)
+        return labels
+
+    def _createLabel(self, database: ParticleDatabase, pdgID: int) -> str:
+        record = database.data.get(str(pdgID))
+        if record is None:
+            return str(pdgID)
+        if self.style == 'latex':
+            return latexLabel(record['symbol'])
+        return record[self.style]
+
+    def label(self, pdgID: int | float) -> str:
+        """
+        Returns the label of a single particle, unknown IDs are labeled by their number
+        """
+        database = self.database
+        labels = self._labels(database)
+        pdgID = int(pdgID)
+        if pdgID not in labels:
+            labels[pdgID] = self._createLabel(database, pdgID)
+        return labels[pdgID]
+
+    def unique(self, ids: np.ndarray) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns the distinct IDs, their labels and the inverse indices,
+        such that labels[inverse] gives the label of every entry
+        """
+        ids = np.asarray(ids)
+        uniqueIDs, inverse = np.unique(ids, return_inverse=True)
+        labels = np.array([self.label(pdgID) for pdgID in uniqueIDs.tolist()], dtype=object)
+        return uniqueIDs, labels, inverse.reshape(ids.shape)
+
+    def __call__(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Returns an array of labels with the same shape as the given IDs
+        """
+        _, labels, inverse = self.unique(ids)
+        return labels[inverse]
+
+
+def formatLabels(ids: np.ndarray, style: str = 'unicode', database: ParticleDatabase = None) -> np.ndarray:
+    """
+    Turns an array of particle IDs into an array of labels in the given style
+    """
+    return LabelFormatter(style, database)(ids)
@@ -1,10 +1,12 @@
+import threading
 from collections import namedtuple
 import numpy as np
-from functools import partial
+from functools import partial, lru_cache
 from .particle import Particle
 from .elementary import Lepton, Strange, AntiStrange
 from .composite import Baryon, Meson
-from functools import partial
+from .database import ParticleDatabase, getDefaultDatabase
+from .create import createParticle
 
 
 # a named tuple that returns if a decay is allowed or not and gives a reason
@@ -86,13 +88,18 @@ def calcRelativisticEnergyMass(parents, daughters, kineticEnergies: list[float]
     return before - after
 """
 
-def checkDecay(parents: list[Particle], daughters: list[Particle]) -> ConservationCheckResult:
-    checks = {
-        'Charge Conservation': chargeConversation(parents, daughters),
-        'Isospin Conservation': isoSpinConservation(parents, daughters),
-        'Baryon Number Conservation': baryonNumberConservation(parents, daughters),
-        'Lepton Number Conservation': leptonNumberConservation(parents, daughters)
-    }
+# the laws checkDecay goes through, more can be added
+conservationLaws = {
+    'Charge Conservation': chargeConversation,
+    'Isospin Conservation': isoSpinConservation,
+    'Baryon Number Conservation': baryonNumberConservation,
+    'Lepton Number Conservation': leptonNumberConservation
+}
+
+
+def checkDecay(parents: list[Particle], daughters: list[Particle], laws: dict = None) -> ConservationCheckResult:
+    laws = conservationLaws if laws is None else laws
+    checks = {name: law(parents, daughters) for name, law in laws.items()}
 
     isPermited = all(result[0] for result in checks.values())
     reasons = [name for name, result in checks.items() if not result[0]]
@@ -100,3 +107,95 @@ def checkDecay(parents: list[Particle], daughters: list[Particle]) -> Conservati
     reason = ', '.join(reasons) + (' is/are violated.' if reasons else '')
 
     return ConservationCheckResult(isPermited=isPermited, reason=reason)
+
+
+# hits and misses of a DecayCache, invalidations counts how often it was emptied
+DecayCacheInfo = namedtuple('DecayCacheInfo', ['hits', 'misses', 'hitRate', 'size', 'maxSize', 'invalidations'])
+
+
+class DecayCache:
+    """
+    Remembers the result of checkDecay for every combination of parents and daughters,
+    the decays are normalized into the sorted IDs of the parents and the daughters,
+    so the order of the daughters doesn't matter. Particles can be passed as Particle
+    objects, IDs or names. The cache is emptied when the laws or the database change
+    """
+    def __init__(self, maxSize: int = 4096, laws: dict = None, database: ParticleDatabase = None) -> None:
+        self._laws = laws
+        self._database = database
+        self._cached = lru_cache(maxsize=maxSize)(self._check)
+        self._cacheKey = None
+        self._lock = threading.Lock()
+        self.invalidations = 0
+
+    @property
+    def laws(self) -> dict:
+        return conservationLaws if self._laws is None else self._laws
+
+    @property
+    def database(self) -> ParticleDatabase:
+        return getDefaultDatabase() if self._database is None else self._database
+
+    def _toID(self, particle: Particle | str | int | float) -> int:
+        if isinstance(particle, Particle):
+            return particle.pdgID
+        if isinstance(particle, str):
+            return int(self.database.findParticle(particle))
+        return int(particle)
+
+    def canonicalKey(self, parents: list | Particle | int, daughters: list) -> tuple[tuple[int], tuple[int]]:
+        """
+        Returns the sorted parent IDs and the sorted daughter IDs
+        """
+        if not isinstance(parents, (list, tuple, np.ndarray)):
+            parents = [parents]
+        return tuple(sorted(self._toID(p) for p in parents)), tuple(sorted(self._toID(d) for d in daughters))
+
+    def _check(self, cacheKey: tuple, parentIDs: tuple[int], daughterIDs: tuple[int]) -> ConservationCheckResult:
+        database = self.database
+        parents = [createParticle(pdgID, database) for pdgID in parentIDs]
+        daughters = [createParticle(pdgID, database) for pdgID in daughterIDs]
+        return checkDecay(parents, daughters, self.laws)
+
+    def _validate(self) -> tuple:
+        # the laws are compared by identity, so replacing or adding one invalidates the cache
+        database = self.database
+        cacheKey = (id(database), database.version, tuple(self.laws.items()))
+        if cacheKey != self._cacheKey:
+            with self._lock:
+                if cacheKey != self._cacheKey:
+                    if self._cacheKey is not None:
+                        self.clear()
+                    self._cacheKey = cacheKey
+        return cacheKey
+
+    def __call__(self, parents: list | Particle | int, daughters: list) -> ConservationCheckResult:
+        # the key is part of every entry, so a thread still checking against an old database can't add stale results
+        cacheKey = self._validate()
+        return self._cached(cacheKey, *self.canonicalKey(parents, daughters))
+
+    def clear(self) -> None:
+        self._cached.cache_clear()
+        self.invalidations += 1
+
+    def info(self) -> DecayCacheInfo:
+        info = self._cached.cache_info()
+        calls = info.hits + info.misses
+        return DecayCacheInfo(
+            hits=info.hits,
+            misses=info.misses,
+            hitRate=info.hits / calls if calls else 0.0,
+            size=info.currsize,
+            maxSize=info.maxsize,
+            invalidations=self.invalidations
+        )
+
+
+decayCache = DecayCache()
+
+
+def cachedCheckDecay(parents: list | Particle | int, daughters: list) -> ConservationCheckResult:
+    """
+    Same as checkDecay, but the results are cached and IDs or names can be used instead of particles
+    """
+    return decayCache(parents, daughters)
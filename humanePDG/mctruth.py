@@ -0,0 +1,200 @@
+from collections import namedtuple
+import numpy as np
+from .database import ParticleDatabase, getDefaultDatabase
+from .columns import getColumns, particleTypes, flavorBits
+
+
+_heavyFlavor = flavorBits['c'] | flavorBits['b']
+_hadrons = (particleTypes.index('meson'), particleTypes.index('baryon'))
+
+
+def _mothers(mothers: np.ndarray) -> np.ndarray:
+    mothers = np.asarray(mothers, dtype=np.int64)
+    if mothers.ndim != 1:
+        raise ValueError('The mother indices have to be a flat array.')
+    if len(mothers) and (mothers.max() >= len(mothers) or mothers.min() < -1):
+        raise ValueError('The mother indices have to point into the particle array or be -1.')
+    return mothers
+
+
+def _maxJumps(n: int) -> int:
+    # every jump doubles the distance covered, so a chain through all particles needs log2(n) of them
+    return int(np.ceil(np.log2(max(n, 2)))) + 1
+
+
+def eventIndices(offsets: np.ndarray) -> np.ndarray:
+    """
+    Returns the event of every particle, offsets holds the start of every event
+    and the total number of particles at the end, e.g., [0, 3, 7] for two events
+    """
+    offsets = np.asarray(offsets, dtype=np.int64)
+    return np.repeat(np.arange(len(offsets) - 1), np.diff(offsets))
+
+
+def globalMotherIndices(motherIndices: np.ndarray, offsets: np.ndarray = None) -> np.ndarray:
+    """
+    Turns mother indices counted within every event into indices into the flat arrays,
+    particles without a mother keep -1. Without offsets the indices are taken as they are
+    """
+    motherIndices = np.asarray(motherIndices, dtype=np.int64)
+    if offsets is None:
+        return _mothers(motherIndices)
+    offsets = np.asarray(offsets, dtype=np.int64)
+    if offsets[-1] != len(motherIndices):
+        raise ValueError(f'The offsets end at {offsets[-1]}, but there are {len(motherIndices)} particles.')
+    starts = offsets[:-1][eventIndices(offsets)]
+    mothers = np.where(motherIndices >= 0, motherIndices + starts, -1)
+    if np.any((motherIndices >= 0) & (mothers >= np.repeat(offsets[1:], np.diff(offsets)))):
+        raise ValueError('A mother index points outside of its event.')
+    return _mothers(mothers)
+
+
+def decayDepth(mothers: np.ndarray) -> tuple[np.ndarray, np.ndarray]:
+    """
+    Returns the number of generations between every particle and the start of its decay chain
+    and the index of that first particle. Every step the particles jump to the ancestor
+    their current ancestor points to, so the whole chain is covered in log2(depth) steps
+    """
+    mothers = _mothers(mothers)
+    depth = (mothers >= 0).astype(np.int64)
+    root = np.where(mothers >= 0, mothers, np.arange(len(mothers)))
+    pointer = mothers.copy()
+    for _ in range(_maxJumps(len(mothers))):
+        pending = pointer >= 0
+        if not pending.any():
+            return depth, root
+        target = pointer[pending]
+        depth[pending] += depth[target]
+        root[pending] = root[target]
+        pointer[pending] = pointer[target]
+    raise ValueError('The mother indices contain a cycle.')
+
+
+def nearestAncestor(mothers: np.ndarray, mask: np.ndarray) -> np.ndarray:
+    """
+    Returns the index of the closest ancestor of every particle for which the mask is set, -1 if there is none
+    """
+    mothers = _mothers(mothers)
+    mask = np.asarray(mask, dtype=bool)
+    # the answer including the particle itself, resolved particles hold it, the others point to the next ancestor to ask
+    pointer = np.where(mask, np.arange(len(mothers)), mothers)
+    resolved = mask | (mothers < 0)
+    for _ in range(_maxJumps(len(mothers))):
+        pending = ~resolved
+        if not pending.any():
+            break
+        target = pointer[pending]
+        pointer[pending] = pointer[target]
+        resolved[pending] = resolved[target]
+    else:
+        if not resolved.all():
+            raise ValueError('The mother indices contain a cycle.')
+    return np.where(mothers >= 0, pointer[np.maximum(mothers, 0)], -1)
+
+
+def ancestorIndices(mothers: np.ndarray, maxDepth: int = None) -> np.ndarray:
+    """
+    Returns the ancestors of every particle as rows of a matrix, mother first, filled up with -1
+    """
+    mothers = _mothers(mothers)
+    if maxDepth is None:
+        maxDepth = int(decayDepth(mothers)[0].max(initial=0))
+    ancestors = np.full((len(mothers), maxDepth), -1, dtype=np.int64)
+    current = mothers
+    for generation in range(maxDepth):
+        ancestors[:, generation] = current
+        current = np.where(current >= 0, mothers[np.maximum(current, 0)], -1)
+    return ancestors
+
+
+def _particleIDs(particles, database: ParticleDatabase) -> np.ndarray:
+    if isinstance(particles, (int, np.integer, str)):
+        particles = [particles]
+    return np.array([abs(int(database.findParticle(p) if isinstance(p, str) else p)) for p in particles], dtype=np.int64)
+
+
+def fromChain(pdgIDs: np.ndarray, mothers: np.ndarray, chain: list, database: ParticleDatabase = None) -> np.ndarray:
+    """
+    Marks the particles coming from the given chain of decays, the particle first, then its mother and so on,
+    e.g., ['pi+', 'D*(2010)+', [511, 521]] for pions from a D* from a B. Every generation can be a name,
+    an ID or a list of them, the charge is ignored
+    """
+    database = getDefaultDatabase() if database is None else database
+    pdgIDs = np.abs(np.asarray(pdgIDs, dtype=np.int64))
+    mothers = _mothers(mothers)
+    current = np.arange(len(pdgIDs))
+    selected = np.ones(len(pdgIDs), dtype=bool)
+    for generation, particles in enumerate(chain):
+        if generation:
+            current = np.where(current >= 0, mothers[np.maximum(current, 0)], -1)
+        selected &= (current >= 0) & np.isin(pdgIDs[np.maximum(current, 0)], _particleIDs(particles, database))
+    return selected
+
+
+class TruthClassification(namedtuple('TruthClassification', ['pdgID', 'mother', 'event', 'depth', 'root', 'heavyAncestor', 'particleType', 'flavor'])):
+    """
+    The classification of every particle of flat MC truth arrays, mother, root and heavyAncestor
+    are indices into the flat arrays, -1 where there is none. particleType is the index into
+    particleTypes, -1 for unknown IDs, flavor the bits of the quark flavors the particle contains
+    """
+    __slots__ = ()
+
+    def _isType(self, particleType: str) -> np.ndarray:
+        return self.particleType == particleTypes.index(particleType)
+
+    @property
+    def isMeson(self) -> np.ndarray:
+        return self._isType('meson')
+
+    @property
+    def isBaryon(self) -> np.ndarray:
+        return self._isType('baryon')
+
+    @property
+    def isLepton(self) -> np.ndarray:
+        return self._isType('lepton')
+
+    @property
+    def isBoson(self) -> np.ndarray:
+        return self._isType('boson')
+
+    @property
+    def isQuark(self) -> np.ndarray:
+        return self._isType('quark')
+
+    @property
+    def isKnown(self) -> np.ndarray:
+        return self.particleType >= 0
+
+    def hasFlavor(self, quark: str) -> np.ndarray:
+        return (self.flavor & flavorBits[quark]) != 0
+
+    @property
+    def fromHeavyFlavor(self) -> np.ndarray:
+        return self.heavyAncestor >= 0
+
+    @property
+    def heavyAncestorID(self) -> np.ndarray:
+        return np.where(self.heavyAncestor >= 0, self.pdgID[np.maximum(self.heavyAncestor, 0)], 0)
+
+
+def classifyTruth(pdgIDs: np.ndarray, motherIndices: np.ndarray, offsets: np.ndarray = None, database: ParticleDatabase = None) -> TruthClassification:
+    """
+    Classifies flat MC truth arrays at once, the mother indices are counted within every event if offsets are given.
+    Gives the decay depth, the first particle of every decay chain, the closest charm or bottom hadron
+    among the ancestors and the particle type and flavor of every particle
+    """
+    pdgIDs = np.asarray(pdgIDs, dtype=np.int64)
+    mothers = globalMotherIndices(motherIndices, offsets)
+    if len(pdgIDs) != len(mothers):
+        raise ValueError(f'There are {len(pdgIDs)} IDs but {len(mothers)} mother indices.')
+    event = np.zeros(len(pdgIDs), dtype=np.int64) if offsets is None else eventIndices(offsets)
+
+    columns = getColumns(database)
+    particleType = columns.lookup(pdgIDs, 'particleType', -1).astype(np.int8)
+    flavor = columns.lookup(pdgIDs, 'flavor', 0).astype(np.uint8)
+    heavy = np.isin(particleType, _hadrons) & ((flavor & _heavyFlavor) != 0)
+
+    depth, root = decayDepth(mothers)
+    heavyAncestor = nearestAncestor(mothers, heavy)
+    return TruthClassification(pdgIDs, mothers, event, depth, root, heavyAncestor, particleType, flavor)
@@ -0,0 +1,48 @@
+import os
+import json
+import struct
+import tempfile
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+
+# every frame starts with the encoding of the payload and its length in bytes
+frameHeader = struct.Struct('!cI')
+JSON = b'J'
+MSGPACK = b'M'
+
+# the functions the lookup server answers, the client mirrors them
+remoteFunctions = [
+    'getParticle', 'getAntiParticle', 'isSelfConjugate', 'getDecayMode', 'getDecayWidth',
+    'getMass', 'getLifetime', 'getCharge', 'getQuarks', 'getSpinType', 'getParticleType',
+    'isQuark', 'isLepton', 'isBoson', 'isMeson', 'isBaryon',
+    'listNames', 'listIDs', 'listPDGNames',
+    'checkDecay', 'conjugate', 'conjugateName', 'conjugateDecay',
+]
+
+
+def defaultSocketPath() -> str:
+    """
+    The socket of the lookup server, it can be set with the HUMANEPDG_SOCKET environment variable
+    """
+    if 'HUMANEPDG_SOCKET' in os.environ:
+        return os.environ['HUMANEPDG_SOCKET']
+    runtimeDir = os.environ.get('XDG_RUNTIME_DIR', tempfile.gettempdir())
+    return os.path.join(runtimeDir, f'humanePDG-{os.getuid()}.sock')
+
+
+def encodeFrame(message, encoding: bytes = JSON) -> bytes:
+    if encoding == MSGPACK:
+        payload = msgpack.packb(message, use_bin_type=True)
+    else:
+        payload = json.dumps(message, separators=(',', ':')).encode()
+    return frameHeader.pack(encoding, len(payload)) + payload
+
+
+def decodePayload(payload: bytes, encoding: bytes = JSON):
+    if encoding == MSGPACK:
+        return msgpack.unpackb(payload, raw=False, strict_map_key=False)
+    return json.loads(payload)
@@ -0,0 +1,202 @@
+import threading
+import weakref
+from collections import Counter
+import numpy as np
+from .database import ParticleDatabase, getDefaultDatabase
+from .composite import recordQuarkTerms
+from .columns import cachedPerDatabase
+
+
+_flavors = 'duscbt'
+# marks following a quark that make it an anti quark, besides writing it in upper case
+_antiMarks = ('~', '\u0304')
+
+
+def canonicalQuarks(quarks: str) -> str:
+    """
+    Brings a quark content into one order, quarks before anti quarks and heavy before light ones,
+    e.g., Du -> uD, udu -> uud. Anti quarks can be written in upper case or followed by ~, e.g., s~
+    """
+    parsed = []
+    for quark in quarks.replace(' ', ''):
+        if quark in _antiMarks:
+            if not parsed or parsed[-1].isupper():
+                raise ValueError(f'{quark!r} has to follow a quark in {quarks!r}.')
+            parsed[-1] = parsed[-1].upper()
+        elif quark.lower() in _flavors:
+            parsed.append(quark)
+        else:
+            raise ValueError(f'Unknown quark {quark!r} in {quarks!r}, use {_flavors} and upper case letters for anti quarks.')
+    return ''.join(sorted(parsed, key=lambda q: (q.isupper(), -_flavors.index(q.lower()))))
+
+
+def _conjugateQuarks(quarks: str) -> str:
+    return canonicalQuarks(quarks.swapcase())
+
+
+def _particleTerms(record: dict) -> tuple[int, tuple[str]]:
+    # the distinct terms of a particle in the canonical order
+    return int(record['pdgID']), tuple(dict.fromkeys(canonicalQuarks(term) for term in recordQuarkTerms(record)))
+
+
+def _quarkCounts(term: str) -> list[tuple[str, int]]:
+    # every (quark, n) the term has at least n of
+    return [(quark, n) for quark, count in Counter(term).items() for n in range(1, count + 1)]
+
+
+class QuarkIndex:
+    """
+    An inverted index from quark contents to particle IDs, every term of a superposition is indexed,
+    so the eta can be found by uU, dD and sS. The queries return sorted arrays of IDs
+    """
+    def __init__(self, database: ParticleDatabase) -> None:
+        self.version = database.version
+        self._particleTerms = {}
+        terms = {}
+        for key in database.data:
+            pdgID, recordTerms = _particleTerms(database.data[key])
+            self._particleTerms[pdgID] = recordTerms
+            for term in recordTerms:
+                terms.setdefault(term, set()).add(pdgID)
+
+        self._terms = {term: np.array(sorted(ids), dtype=np.int64) for term, ids in terms.items()}
+        # for contains, the terms with at least n of a quark, as a set per quark and n
+        quarkCounts = {}
+        for term in self._terms:
+            for count in _quarkCounts(term):
+                quarkCounts.setdefault(count, set()).add(term)
+        self._quarkCounts = {count: frozenset(terms) for count, terms in quarkCounts.items()}
+
+        self._ids = np.array(sorted(self._particleTerms), dtype=np.int64)
+        self._contents = np.array(['+'.join(self._particleTerms[pdgID]) for pdgID in self._ids.tolist()], dtype=object)
+
+    def update(self, database: ParticleDatabase, changed: list[str], version: int) -> 'QuarkIndex':
+        """
+        Returns a new index with only the terms of the changed particles updated,
+        the index itself is never changed, so other threads can keep using it
+        """
+        index = QuarkIndex.__new__(QuarkIndex)
+        index.version = version
+        index._particleTerms = dict(self._particleTerms)
+        index._terms = dict(self._terms)
+        index._quarkCounts = dict(self._quarkCounts)
+        ids, contents = self._ids, self._contents
+
+        changedIDs = set()
+        affected = set()
+        for key in changed:
+            pdgID = int(key)
+            changedIDs.add(pdgID)
+            affected.update(index._particleTerms.pop(pdgID, ()))
+            position = np.searchsorted(ids, pdgID)
+            exists = position < len(ids) and ids[position] == pdgID
+            if key in database.data:
+                _, recordTerms = _particleTerms(database.data[key])
+                index._particleTerms[pdgID] = recordTerms
+                affected.update(recordTerms)
+                if exists:
+                    contents = contents.copy()
+                    contents[position] = '+'.join(recordTerms)
+                else:
+                    ids = np.insert(ids, position, pdgID)
+                    contents = np.insert(contents, position, '+'.join(recordTerms))
+            elif exists:
+                ids = np.delete(ids, position)
+                contents = np.delete(contents, position)
+        index._ids, index._contents = ids, contents
+
+        for term in affected:
+            termIDs = set(index._terms.get(term, np.empty(0, dtype=np.int64)).tolist()) - changedIDs
+            termIDs.update(pdgID for pdgID in changedIDs if term in index._particleTerms.get(pdgID, ()))
+            if termIDs:
+                if term not in index._terms:
+                    for count in _quarkCounts(term):
+                        index._quarkCounts[count] = index._quarkCounts.get(count, frozenset()) | {term}
+                index._terms[term] = np.array(sorted(termIDs), dtype=np.int64)
+            elif term in index._terms:
+                del index._terms[term]
+                for count in _quarkCounts(term):
+                    index._quarkCounts[count] = index._quarkCounts[count] - {term}
+                    if not index._quarkCounts[count]:
+                        del index._quarkCounts[count]
+        return index
+
+    @property
+    def terms(self) -> list[str]:
+        return sorted(self._terms)
+
+    def _termIDs(self, terms: set[str]) -> np.ndarray:
+        arrays = [self._terms[term] for term in terms if term in self._terms]
+        return np.unique(np.concatenate(arrays)) if arrays else np.empty(0, dtype=np.int64)
+
+    def _queries(self, quarks: str, conjugate: bool) -> set[str]:
+        quarks = canonicalQuarks(quarks)
+        return {quarks, _conjugateQuarks(quarks)} if conjugate else {quarks}
+
+    def exact(self, quarks: str, conjugate: bool = False) -> np.ndarray:
+        """
+        Returns the IDs of the particles with exactly this quark content, e.g., uD for the pi+,
+        with conjugate also those with the charge conjugated content
+        """
+        return self._termIDs(self._queries(quarks, conjugate))
+
+    def contains(self, quarks: str, conjugate: bool = False) -> np.ndarray:
+        """
+        Returns the IDs of the particles containing at least these quarks, e.g., cS for all
+        hadrons with a c and an anti s quark, with conjugate also those containing the charge conjugated quarks
+        """
+        terms = set()
+        for query in self._queries(quarks, conjugate):
+            matching = set(self._terms)
+            for quark, count in Counter(query).items():
+                matching &= self._quarkCounts.get((quark, count), set())
+            terms |= matching
+        return self._termIDs(terms)
+
+    def flavored(self, flavors: str) -> np.ndarray:
+        """
+        Returns the IDs of the particles containing all the given flavors, as quark or anti quark
+        """
+        terms = set(self._terms)
+        for flavor in set(canonicalQuarks(flavors).lower()):
+            terms &= self._quarkCounts.get((flavor, 1), set()) | self._quarkCounts.get((flavor.upper(), 1), set())
+        return self._termIDs(terms)
+
+    def content(self, ids: np.ndarray) -> np.ndarray:
+        """
+        Returns the quark content of every ID in the canonical order, superpositions joined by +,
+        e.g., uD for the pi+ and uU+dD for the pi0, unknown IDs and particles without quarks get ''
+        """
+        ids = np.asarray(ids)
+        index = np.minimum(np.searchsorted(self._ids, ids), len(self._ids) - 1)
+        return np.where(self._ids[index] == ids, self._contents[index], '')
+
+    def group(self, ids: np.ndarray) -> dict[str, np.ndarray]:
+        """
+        Groups an array of IDs by their quark content, returns the positions in the array for every content
+        """
+        contents, inverse = np.unique(self.content(np.ravel(ids)).astype(str), return_inverse=True)
+        order = np.argsort(inverse, kind='stable')
+        splits = np.split(order, np.cumsum(np.bincount(inverse.ravel(), minlength=len(contents)))[:-1])
+        return dict(zip(contents.tolist(), splits))
+
+
+_quarkIndices = weakref.WeakKeyDictionary()
+_quarkIndicesLock = threading.Lock()
+
+
+def getQuarkIndex(database: ParticleDatabase = None) -> QuarkIndex:
+    """
+    Returns the quark index of a database, by default of the default database,
+    it's built on first use and afterwards only patched for the changed particles
+    """
+    database = getDefaultDatabase() if database is None else database
+    return cachedPerDatabase(_quarkIndices, _quarkIndicesLock, database, QuarkIndex)
+
+
+def findByQuarks(quarks: str, contains: bool = False, conjugate: bool = False, database: ParticleDatabase = None) -> np.ndarray:
+    """
+    Returns the IDs of the particles with this quark content, or containing it with contains
+    """
+    index = getQuarkIndex(database)
+    return index.contains(quarks, conjugate) if contains else index.exact(quarks, conjugate)
@@ -0,0 +1,122 @@
+import os
+import asyncio
+import argparse
+from enum import Enum
+import numpy as np
+from . import humane
+from .laws import cachedCheckDecay, ConservationCheckResult
+from .conjugation import conjugate, conjugateName, conjugateDecay
+from .columns import getColumns
+from .protocol import frameHeader, JSON, MSGPACK, msgpack, remoteFunctions, defaultSocketPath, encodeFrame, decodePayload
+
+
+_handlers = {name: getattr(humane, name) for name in remoteFunctions if hasattr(humane, name)}
+_handlers.update({
+    'checkDecay': cachedCheckDecay,
+    'conjugate': lambda ids: conjugate(np.asarray(ids)),
+    'conjugateName': conjugateName,
+    'conjugateDecay': conjugateDecay,
+})
+
+
+def _encodeValue(value):
+    """
+    Turns the results of the lookups into something json and msgpack can handle
+    """
+    if isinstance(value, ConservationCheckResult):
+        return {'__decay__': [bool(value.isPermited), value.reason]}
+    if isinstance(value, Enum):
+        return {'__enum__': [type(value).__name__, value.name]}
+    if isinstance(value, (np.ndarray, np.generic)):
+        return value.tolist()
+    if isinstance(value, (list, tuple)):
+        return [_encodeValue(v) for v in value]
+    return value
+
+
+def handleCalls(calls: list) -> list:
+    """
+    Answers a batch of calls, each one as [function, *arguments], every call gets
+    either [True, result] or [False, [error type, message]], so one failing lookup
+    doesn't spoil the rest of the batch
+    """
+    results = []
+    for call in calls:
+        try:
+            if not isinstance(call, (list, tuple)) or not call or not isinstance(call[0], str):
+                raise TypeError(f'a call has to be [function, *arguments], got {call!r}')
+            function, *arguments = call
+            if function not in _handlers:
+                raise AttributeError(f'unknown function {function}')
+            results.append([True, _encodeValue(_handlers[function](*arguments))])
+        except Exception as error:
+            results.append([False, [type(error).__name__, str(error)]])
+    return results
+
+
+def handleRequest(request) -> dict:
+    """
+    Answers a decoded request, malformed requests get an error instead of results
+    """
+    if not isinstance(request, dict) or not isinstance(request.get('calls'), (list, tuple)):
+        return {'error': ['ValueError', "a request has to be {'calls': [[function, *arguments], ...]}"]}
+    return {'results': handleCalls(request['calls'])}
+
+
+async def _serveClient(reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+    try:
+        while True:
+            try:
+                encoding, length = frameHeader.unpack(await reader.readexactly(frameHeader.size))
+                payload = await reader.readexactly(length)
+            except asyncio.IncompleteReadError:
+                break
+
+            if encoding == MSGPACK and msgpack is None:
+                writer.write(encodeFrame({'error': ['ValueError', 'the server has no msgpack, use json']}, JSON))
+            else:
+                try:
+                    response = handleRequest(decodePayload(payload, encoding))
+                except Exception as error:
+                    # payloads that can't be decoded, the connection stays usable for the next frame
+                    response = {'error': [type(error).__name__, f'the request could not be decoded: {error}']}
+                writer.write(encodeFrame(response, encoding if encoding in (JSON, MSGPACK) else JSON))
+            await writer.drain()
+    finally:
+        writer.close()
+
+
+async def serve(path: str = None) -> None:
+    """
+    Answers lookups on a unix domain socket until cancelled
+    """
+    path = defaultSocketPath() if path is None else path
+    if os.path.exists(path):
+        os.unlink(path)
+
+    # everything is loaded up front, so the first request isn't slower than the others
+    humane.getDefaultDatabase()
+    getColumns()
+
+    server = await asyncio.start_unix_server(_serveClient, path=path)
+    os.chmod(path, 0o600)
+    try:
+        async with server:
+            await server.serve_forever()
+    finally:
+        if os.path.exists(path):
+            os.unlink(path)
+
+
+def main(argv: list[str] = None) -> None:
+    parser = argparse.ArgumentParser(description='A local server answering particle lookups over a unix domain socket')
+    parser.add_argument('--socket', default=None, help=f'the socket path, by default {defaultSocketPath()}')
+    arguments = parser.parse_args(argv)
+    try:
+        asyncio.run(serve(arguments.socket))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == '__main__':
+    main()
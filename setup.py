@@ -20,6 +20,10 @@ setuptools.setup(
         "numpy>=1.21.0",
         "importlib_resources>=6.1.0"
     ],
+    extras_require={
+        "msgpack": ["msgpack>=1.0.0"],
+        "pandas": ["pandas>=1.3.0"],
+    },
     keywords=['python', 'pdg', 'root'],
     classifiers= [
         "Development Status :: 0.1",
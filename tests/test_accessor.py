@@ -0,0 +1,24 @@
+import numpy as np
+import pytest
+from humanePDG import getColumns
+
+pd = pytest.importorskip('pandas')
+import humanePDG.accessor  # noqa: E402,F401
+
+
+def testLookupKeepsTheType():
+    columns = getColumns()
+    assert columns.lookup([211, 999999], 'selfConjugated').dtype == bool
+    assert columns.lookup([211, 999999], 'antiParticle').tolist() == [-211, 0]
+    assert np.isnan(columns.lookup([999999], 'mass')[0])
+    assert columns.lookup([999999], 'name').tolist() == ['']
+
+
+def testNullableColumns():
+    ids = pd.Series([211, None, 999999, 111])
+    assert str(ids.pdg.selfConjugated.dtype) == 'boolean'
+    assert ids.pdg.selfConjugated.tolist() == [False, pd.NA, pd.NA, True]
+    assert str(ids.pdg.antiParticle.dtype) == 'Int64'
+    assert ids.pdg.antiParticle.tolist() == [-211, pd.NA, pd.NA, 111]
+    assert ids.pdg.mass.isna().tolist() == [False, True, True, False]
+    assert ids.pdg.name.tolist() == ['PionPlus', '', '', 'Pion']
@@ -0,0 +1,47 @@
+import pytest
+from humanePDG import conjugateName, getDefaultDatabase
+
+_tables = ('symbolsData', 'programmNamesData', 'namesData', 'pdgNamesData')
+_fields = {'symbolsData': 'symbol', 'programmNamesData': 'programmName', 'namesData': 'name', 'pdgNamesData': 'pdgName'}
+
+
+def testConventions():
+    assert conjugateName('PionPlus') == 'PionMinus'
+    assert conjugateName('AntiDuty') == 'Duty'
+    assert conjugateName('Lambda_c_2880_minus_bar') == 'Lambda_c_2880_plus'
+    assert conjugateName('D0') == 'D~0'
+    assert conjugateName('pi_plus') == 'pi_minus'
+    assert conjugateName('d 0 bar') == 'd 0'
+    assert conjugateName('211') == '-211'
+
+
+def _names(database, table: str) -> dict[str, str]:
+    # the names of the table that are found as the particle they belong to, and not in an earlier table already
+    earlier = [getattr(database, other) for other in _tables[:_tables.index(table)]]
+    names = {}
+    for name, pdgID in getattr(database, table).items():
+        try:
+            identifier = database.findParticle(name)
+        except (KeyError, ValueError):
+            continue
+        if identifier == str(pdgID) and identifier in database.data and not any(str(other.get(name)) == identifier for other in earlier):
+            names[name] = identifier
+    return names
+
+
+@pytest.mark.parametrize('table', _tables)
+def testRoundTrip(table):
+    database = getDefaultDatabase()
+    names = _names(database, table)
+    identifiers = set(names.values())
+    for name, identifier in names.items():
+        antiParticle = str(database.getAntiParticle(int(identifier)))
+        conjugated = conjugateName(name)
+        assert database.findParticle(conjugated) == antiParticle, (name, conjugated)
+        assert database.findParticle(conjugateName(conjugated)) == identifier, (name, conjugated)
+        # without a name for the anti particle in the table, e.g., AntiOmegaPlus, the symbol is used
+        if antiParticle in identifiers:
+            assert conjugated in getattr(database, table), (name, conjugated)
+            # the entries of the records come back as they were, aliases like d 0 bar as the entry
+            if conjugated in names and name == database.data[identifier][_fields[table]]:
+                assert conjugateName(conjugated) == name, (name, conjugated)
@@ -0,0 +1,30 @@
+import pytest
+from humanePDG import compileDescriptor
+from humanePDG.laws import chargeConversation
+
+
+def testNestedDescriptor():
+    descriptor = compileDescriptor('B0 -> [D- -> K+ pi- pi-] pi+ cc')
+    assert descriptor.chargeConjugate
+    assert descriptor.matches((511, [(211, []), (-411, [(321, []), (-211, []), (-211, [])])]))
+    assert descriptor.matches((-511, [(-211, []), (411, [(-321, []), (211, []), (211, [])])]))
+
+
+@pytest.mark.parametrize('descriptor', [
+    '[B0 -> D- pi+ cc',
+    '[B0 -> D- pi+',
+    'B0 -> [D- -> K+ pi- pi- pi+',
+    'B0 -> [D- -> K+ pi- pi- cc] pi+',
+    'B0 -> D- pi+ ]',
+])
+def testUnbalancedBrackets(descriptor):
+    with pytest.raises(ValueError):
+        compileDescriptor(descriptor)
+
+
+def testLawsAreChecked():
+    # the charge of the K+ pi+ is +2
+    descriptor = 'D0 -> K+ pi+'
+    assert compileDescriptor(descriptor).violations
+    assert not compileDescriptor(descriptor, laws={}).violations
+    assert compileDescriptor(descriptor, laws={'Charge Conservation': chargeConversation}).violations
@@ -0,0 +1,13 @@
+import numpy as np
+import pytest
+from humanePDG.finalstates import finalStates
+
+
+def testNumpyParent():
+    assert list(finalStates(np.int64(421), (2,))) == list(finalStates(421, (2,)))
+
+
+@pytest.mark.parametrize('bodies', [(0,), (2, -1)])
+def testInvalidBodies(bodies):
+    with pytest.raises(ValueError):
+        list(finalStates('D0', bodies))
@@ -0,0 +1,53 @@
+import numpy as np
+from humanePDG import findByQuarks, canonicalQuarks, getDefaultDatabase, getColumns
+from humanePDG.composite import recordQuarkTerms
+
+
+def testHeavyQuarks():
+    assert findByQuarks('b').tolist() == [5]
+    assert findByQuarks('t').tolist() == [6]
+    assert findByQuarks('B').tolist() == [-5]
+
+
+def testDiquarkContent():
+    database = getDefaultDatabase()
+    assert recordQuarkTerms(database.data['5101']) == ['bd']
+    assert recordQuarkTerms(database.data['-2101']) == ['UD']
+
+
+def testFlavorBits():
+    assert getColumns().lookup([5, 6], 'flavor').tolist() == [16, 32]
+
+
+def testCanonicalOrder():
+    assert canonicalQuarks('Du') == 'uD'
+    assert canonicalQuarks('udb') == 'bud'
+    assert canonicalQuarks('bt') == 'tb'
+    assert canonicalQuarks('cs~') == 'cS'
+
+
+def testSuperpositionTerms():
+    assert 111 in findByQuarks('dD')
+    assert 111 in findByQuarks('uU')
+    assert np.all(np.isin([431, -431], findByQuarks('cS', conjugate=True)))
+
+
+def testPatchedIndexMatchesRebuild():
+    from humanePDG import ParticleOverlay, getQuarkIndex
+    from humanePDG.quarkindex import QuarkIndex
+    overlay = ParticleOverlay()
+    first = getQuarkIndex(overlay)
+    overlay.register({'pdgID': 9900441, 'particleType': 'meson', 'name': 'XTestcc', 'quarks': 'cC'})
+    overlay.register({'pdgID': 9900442, 'particleType': 'meson', 'name': 'XTesttt', 'quarks': 'tTtT'})
+    overlay.register({'pdgID': 421, 'quarks': '(cU+uC)/sqrt(2)'})
+    overlay.unregister(9900442)
+
+    patched = getQuarkIndex(overlay)
+    rebuilt = QuarkIndex(overlay)
+    assert patched is not first and patched.version == overlay.version
+    assert patched.terms == rebuilt.terms
+    for term in rebuilt.terms:
+        assert patched.exact(term).tolist() == rebuilt.exact(term).tolist()
+        assert patched.contains(term).tolist() == rebuilt.contains(term).tolist()
+    assert patched.content([421, 9900441, 9900442]).tolist() == ['cU+uC', 'cC', '']
+    assert 9900441 in findByQuarks('cC', database=overlay)